@@ -0,0 +1,41 @@
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pyrectus import Directus, AsyncDirectus
+    from .api.transport import Transport, AsyncTransport, DirectusError
+    from .api.cache import ResponseCache
+    from .api.retry import RetryPolicy, RateLimiter
+
+__all__ = ['Directus', 'AsyncDirectus', 'Transport', 'AsyncTransport', 'DirectusError', 'ResponseCache', 'RetryPolicy', 'RateLimiter', 'main']
+
+_LAZY = {
+    'Directus': '.pyrectus',
+    'AsyncDirectus': '.pyrectus',
+    'Transport': '.api.transport',
+    'AsyncTransport': '.api.transport',
+    'DirectusError': '.api.transport',
+    'ResponseCache': '.api.cache',
+    'RetryPolicy': '.api.retry',
+    'RateLimiter': '.api.retry',
+}
+"""Public name to the module defining it, imported on first access (PEP 562).
+`import pyrectus` stays cheap for the CLI, httpx is only loaded by the client"""
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def main() -> None:
+    """Entry point of the `pyrectus` console script"""
+    from .cli import app
+    app()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+import asyncio
+import json
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, NamedTuple, TypeVar
+
+from httpx import HTTPError
+
+from .transport import DirectusError
+
+__all__ = ['CHUNK_ERRORS', 'chunked', 'ChunkResult', 'BatchResult', 'BatchError', 'run_batches', 'arun_batches']
+
+_T = TypeVar('_T')
+
+CHUNK_ERRORS: tuple[type[Exception], ...] = (DirectusError, HTTPError)
+"""Exceptions recorded on a failed `ChunkResult` instead of aborting the batch"""
+
+
+def chunked(items: Iterable[_T], max_items: int = 500, max_bytes: int | None = None) -> Iterator[list[_T]]:
+    """Split `items` into lists of at most `max_items`, and at most `max_bytes` of
+    JSON when given. A single item larger than `max_bytes` is sent on its own"""
+    if max_items < 1:
+        raise ValueError('max_items must be at least 1')
+    chunk: list[_T] = []
+    size = 0
+    for item in items:
+        item_size = len(json.dumps(item, separators=(',', ':'))) + 1 if max_bytes else 0
+        if chunk and (len(chunk) >= max_items or (max_bytes and size + item_size > max_bytes)):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        yield chunk
+
+
+class ChunkResult(NamedTuple):
+    index: int
+    """Position of the chunk in the input"""
+    items: list[Any]
+    """What was sent (items or keys)"""
+    data: Any = None
+    """Unwrapped response data on success"""
+    error: Exception | None = None
+    """The `DirectusError`/`httpx.HTTPError` (or file error for transfers) if the chunk failed"""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchError(Exception):
+    def __init__(self, result: BatchResult) -> None:
+        self.result = result
+        failed = result.failed
+        super().__init__(f'{len(failed)} of {len(result)} chunks failed, first error: {failed[0].error}')
+
+
+class BatchResult(list[ChunkResult]):
+    """Per-chunk outcome of a bulk operation, in input order. Failed chunks do not
+    stop the others, inspect `failed` or call `raise_for_errors`"""
+
+    @property
+    def succeeded(self) -> list[ChunkResult]:
+        return [c for c in self if c.ok]
+
+    @property
+    def failed(self) -> list[ChunkResult]:
+        return [c for c in self if not c.ok]
+
+    @property
+    def data(self) -> list[Any]:
+        """Response data of every successful chunk, flattened"""
+        return [
+            record
+            for chunk in self.succeeded if chunk.data is not None
+            for record in (chunk.data if isinstance(chunk.data, list) else [chunk.data])
+        ]
+
+    def raise_for_errors(self) -> BatchResult:
+        if self.failed:
+            raise BatchError(self)
+        return self
+
+
+def run_batches(send: Callable[[list[_T]], Any], chunks: Iterable[list[_T]], max_workers: int = 4, errors: tuple[type[Exception], ...] = CHUNK_ERRORS) -> BatchResult:
+    """Send chunks concurrently on a thread pool, at most `max_workers` in flight.
+    A chunk raising one of `errors` is recorded as failed, anything else propagates"""
+    def attempt(index: int, chunk: list[_T]) -> ChunkResult:
+        try:
+            return ChunkResult(index, chunk, send(chunk))
+        except errors as e:
+            return ChunkResult(index, chunk, error=e)
+
+    result = BatchResult()
+    queued = enumerate(chunks)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pyrectus-batch') as executor:
+        window: deque[Future[ChunkResult]] = deque(executor.submit(attempt, *job) for _, job in zip(range(max_workers), queued))
+        while window:
+            result.append(window.popleft().result())
+            if (job := next(queued, None)) is not None:
+                window.append(executor.submit(attempt, *job))
+    return result
+
+
+async def arun_batches(send: Callable[[list[_T]], Awaitable[Any]], chunks: Iterable[list[_T]], max_workers: int = 4, errors: tuple[type[Exception], ...] = CHUNK_ERRORS) -> BatchResult:
+    """Async counterpart of `run_batches`, with `max_workers` concurrent tasks"""
+    async def attempt(index: int, chunk: list[_T]) -> ChunkResult:
+        try:
+            return ChunkResult(index, chunk, await send(chunk))
+        except errors as e:
+            return ChunkResult(index, chunk, error=e)
+
+    result = BatchResult()
+    queued = enumerate(chunks)
+    window: deque[asyncio.Task[ChunkResult]] = deque(asyncio.ensure_future(attempt(*job)) for _, job in zip(range(max_workers), queued))
+    while window:
+        result.append(await window.popleft())
+        if (job := next(queued, None)) is not None:
+            window.append(asyncio.ensure_future(attempt(*job)))
+    return result
@@ -0,0 +1,153 @@
+from __future__ import annotations
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from threading import Lock
+
+from httpx import Request, Response
+
+__all__ = ['ResponseCache', 'DEFAULT_TTLS', 'cache_scope']
+
+DEFAULT_TTLS: dict[str, float] = {
+    'collections': 300.0,
+    'fields': 300.0,
+    'relations': 300.0,
+    'settings': 60.0,
+    'roles': 60.0,
+    'policies': 60.0,
+}
+"""Seconds a response is served without revalidation, by top level path segment.
+Metadata endpoints change rarely and are read on almost every request path"""
+
+
+def _segment(url: str) -> str:
+    """`/collections/articles?fields=*` -> `collections`"""
+    return url.split('?', 1)[0].strip('/').split('/', 1)[0]
+
+
+@lru_cache(maxsize=64)
+def cache_scope(base_url: str, authorization: str | None) -> str:
+    """Partition of a `ResponseCache` for one instance and one set of credentials.
+    Directus filters most responses by permission, so users never share entries"""
+    return hashlib.sha256(f'{base_url}\n{authorization or ""}'.encode()).hexdigest()
+
+
+class CacheEntry:
+    __slots__ = ('status_code', 'headers', 'content', 'expires', 'size')
+
+    def __init__(self, response: Response, ttl: float) -> None:
+        self.status_code = response.status_code
+        self.headers = [
+            (k, v) for k, v in response.headers.multi_items()
+            if k.lower() not in ('content-encoding', 'transfer-encoding', 'content-length')
+        ]
+        self.content = response.content
+        self.size = len(self.content) + sum(len(k) + len(v) for k, v in self.headers)
+        self.refresh(ttl)
+
+    def refresh(self, ttl: float) -> None:
+        self.expires = time.monotonic() + ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = dict(self.headers)
+        validators = {}
+        if etag := headers.get('etag'):
+            validators['If-None-Match'] = etag
+        if modified := headers.get('last-modified'):
+            validators['If-Modified-Since'] = modified
+        return validators
+
+    def response(self, request: Request) -> Response:
+        return Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class ResponseCache:
+    """LRU of GET responses bounded by total bytes.
+
+    An entry is served without a request while its TTL (from `ttls`, by top level
+    path segment, else `default_ttl`) has not expired. After that it is revalidated
+    with `If-None-Match`/`If-Modified-Since`, and a `304` refreshes it in place.
+    Responses with neither a TTL nor a validator are not stored. A successful write
+    to a resource drops the cached responses under the same top level segment, and
+    a GET that was already in flight during the write is not stored.
+
+    Entries are kept per `cache_scope` (instance url and `Authorization` header),
+    so the cache can be shared between threads, between a `Transport` and an
+    `AsyncTransport`, and between transports using different tokens.
+
+    Example:
+        ```
+        Directus(url, token, cache=ResponseCache(max_bytes=32 * 2**20))
+        ```
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, *, ttls: Mapping[str, float] = DEFAULT_TTLS, default_ttl: float = 0.0) -> None:
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls)
+        self.default_ttl = default_ttl
+        self.size = 0
+        self._entries: OrderedDict[tuple[str, str], CacheEntry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = Lock()
+
+    def ttl(self, url: str) -> float:
+        return self.ttls.get(_segment(url), self.default_ttl)
+
+    def get(self, url: str, scope: str = '') -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get((scope, url))
+            if entry is not None:
+                self._entries.move_to_end((scope, url))
+            return entry
+
+    def generation(self, url: str) -> int:
+        """Count of writes to the segment of `url`, read before sending a GET and
+        passed to `store` so a response older than a write is dropped"""
+        return self._generations.get(_segment(url), 0)
+
+    def store(self, url: str, response: Response, scope: str = '', generation: int | None = None) -> None:
+        if response.status_code != 200:
+            return
+        ttl = self.ttl(url)
+        if ttl <= 0 and not ('etag' in response.headers or 'last-modified' in response.headers):
+            return
+        entry = CacheEntry(response, ttl)
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation(url):
+                return
+            if (old := self._entries.pop((scope, url), None)) is not None:
+                self.size -= old.size
+            self._entries[scope, url] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def revalidated(self, url: str, entry: CacheEntry) -> None:
+        """Mark an entry as confirmed by a `304 Not Modified`"""
+        entry.refresh(self.ttl(url))
+
+    def invalidate(self, url: str) -> None:
+        """Drop every entry under the same top level segment as `url`, in every scope"""
+        segment = _segment(url)
+        with self._lock:
+            self._generations[segment] = self._generations.get(segment, 0) + 1
+            for key in [k for k in self._entries if _segment(k[1]) == segment]:
+                self.size -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,286 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Container, Iterable, Iterator
+from typing import Any, Literal
+
+__all__ = ['Columns', 'to_columns', 'to_numpy', 'DType', 'field_dtypes', 'Column', 'Table', 'TableBuilder', 'to_table']
+
+Columns = dict[str, list[Any]]
+"""Column name to values, all columns the same length"""
+
+DType = Literal['int', 'float', 'bool', 'str', 'object']
+
+_FIELD_DTYPES: dict[str, DType] = {
+    'integer': 'int',
+    'bigInteger': 'int',
+    'float': 'float',
+    'decimal': 'float',
+    'boolean': 'bool',
+    'string': 'str',
+    'text': 'str',
+    'uuid': 'str',
+    'hash': 'str',
+    'date': 'str',
+    'time': 'str',
+    'dateTime': 'str',
+    'timestamp': 'str',
+}
+"""Directus field types with a typed column, anything else (json, csv, alias, geometry) is `object`"""
+
+_TYPECODES = {'int': 'q', 'float': 'd', 'bool': 'b'}
+
+
+def _number(value: Any) -> Any:
+    """Some databases return numeric aggregates (`sum`, `avg`) as strings"""
+    if not isinstance(value, str):
+        return value
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _flatten(row: dict[str, Any], prefix: str = '', keep: Container[str] = ()) -> Iterable[tuple[str, Any]]:
+    """Dotted names of nested values, objects in a `keep` column are left whole"""
+    for key, value in row.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict) and name not in keep:
+            yield from _flatten(value, f'{name}.', keep)
+        else:
+            yield name, value
+
+
+def to_columns(rows: Iterable[dict[str, Any]], *, numeric: Iterable[str] = ()) -> Columns:
+    """Pivot a list of records into columns.
+
+    Nested objects become dotted columns, so an aggregate row such as
+    `{"country": "NL", "count": {"id": 3}}` yields `country` and `count.id`.
+    Columns named in `numeric` (or nested under one) have numeric strings parsed.
+    Missing values are `None`.
+    """
+    numeric = tuple(numeric)
+    columns: Columns = {}
+    length = 0
+    for row in rows:
+        for name, value in _flatten(row):
+            if name not in columns:
+                columns[name] = [None] * length
+            if numeric and name.split('.')[0] in numeric:
+                value = _number(value)
+            columns[name].append(value)
+        length += 1
+        for values in columns.values():
+            if len(values) < length:
+                values.append(None)
+    return columns
+
+
+def to_numpy(columns: Columns) -> dict[str, Any]:
+    """Convert each column to a NumPy array (requires `numpy`)"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('to_numpy requires numpy, install it with `pip install numpy`') from None
+    return {name: numpy.asarray(values) for name, values in columns.items()}
+
+
+def field_dtypes(fields: Iterable[dict[str, Any]], collection: str) -> dict[str, DType]:
+    """Column dtypes of `collection` from field metadata, such as the `fields` of a
+    (cached) schema snapshot or the `/fields` listing"""
+    return {
+        field['field']: _FIELD_DTYPES.get(field.get('type') or '', 'object')
+        for field in fields if field.get('collection') == collection
+    }
+
+
+def _convert(dtype: DType, value: Any) -> Any:
+    """Parse a JSON value into the column type, decimals and big integers arrive as strings"""
+    if dtype == 'int':
+        return int(value)
+    if dtype == 'float':
+        return float(value)
+    if dtype == 'bool':
+        if isinstance(value, str):
+            return {'true': True, 'false': False, '1': True, '0': False}[value.lower()]
+        return bool(int(value))
+    if dtype == 'str' and not isinstance(value, str):
+        raise TypeError(f'expected a string, got {type(value).__name__}')
+    return value
+
+
+class Column:
+    """Values of one field. `int`, `float` and `bool` columns are packed machine
+    values in an `array` (8 bytes per int/float), `str`/`object` columns are lists.
+
+    Nulls are tracked in a byte mask, created on the first null. A value that does
+    not fit the dtype turns the column into an `object` column.
+    """
+    __slots__ = ('dtype', 'values', 'nulls')
+
+    def __init__(self, dtype: DType, length: int = 0) -> None:
+        self.dtype = dtype
+        self.values: array[Any] | list[Any] = array(_TYPECODES[dtype]) if dtype in _TYPECODES else []
+        self.nulls: bytearray | None = None
+        for _ in range(length):
+            self.append(None)
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            if self.nulls is None:
+                self.nulls = bytearray(len(self.values))
+            self.nulls.append(1)
+            self.values.append(0 if isinstance(self.values, array) else None)
+            return
+        if self.dtype != 'object':
+            try:
+                value = _convert(self.dtype, value)
+                self.values.append(value)
+            except (TypeError, ValueError, KeyError, OverflowError):
+                self._degrade()
+                self.values.append(value)
+        else:
+            self.values.append(value)
+        if self.nulls is not None:
+            self.nulls.append(0)
+
+    def _degrade(self) -> None:
+        self.values = self.to_list()
+        self.dtype = 'object'
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.to_list())
+
+    def __getitem__(self, index: int) -> Any:
+        return None if self.nulls is not None and self.nulls[index] else self.values[index]
+
+    def to_list(self) -> list[Any]:
+        values = self.values.tolist() if isinstance(self.values, array) else list(self.values)
+        if self.dtype == 'bool':
+            values = [bool(v) for v in values]
+        if self.nulls is not None:
+            return [None if null else v for v, null in zip(values, self.nulls)]
+        return values
+
+    def to_numpy(self) -> Any:
+        """Zero-copy view of packed columns, a masked array when there are nulls"""
+        import numpy
+        if isinstance(self.values, array):
+            data = numpy.frombuffer(self.values, dtype={'q': numpy.int64, 'd': numpy.float64, 'b': numpy.int8}[self.values.typecode])
+            if self.dtype == 'bool':
+                data = data.astype(bool)
+        else:
+            data = numpy.empty(len(self.values), dtype=object)
+            data[:] = self.values
+        if self.nulls is not None:
+            return numpy.ma.masked_array(data, mask=numpy.frombuffer(self.nulls, dtype=numpy.bool_))
+        return data
+
+    def __repr__(self) -> str:
+        return f'Column({self.dtype!r}, length={len(self)})'
+
+
+class Table:
+    """Typed columns of a query result, see `TableBuilder`.
+
+    Example:
+        ```
+        table = directus.items.table('orders', Fields('id', 'total', 'status'), Limit(-1))
+        totals = table['total'].to_numpy()
+        ```
+    """
+
+    def __init__(self, columns: dict[str, Column], length: int) -> None:
+        self.columns = columns
+        self.length = length
+
+    @property
+    def dtypes(self) -> dict[str, DType]:
+        return {name: column.dtype for name, column in self.columns.items()}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.columns
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Rebuild the records (nested fields stay dotted)"""
+        names = list(self.columns)
+        for values in zip(*(self.columns[name].to_list() for name in names)):
+            yield dict(zip(names, values))
+
+    def to_columns(self) -> Columns:
+        return {name: column.to_list() for name, column in self.columns.items()}
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Column name to NumPy array (requires `numpy`)"""
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise ImportError('to_numpy requires numpy, install it with `pip install numpy`') from None
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+
+    def to_arrow(self) -> Any:
+        """A `pyarrow.Table` (requires `pyarrow`). Packed columns without nulls are
+        handed over without copying"""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError('to_arrow requires pyarrow, install it with `pip install pyarrow`') from None
+        types = {'int': pyarrow.int64(), 'float': pyarrow.float64(), 'bool': pyarrow.bool_(), 'str': pyarrow.string()}
+        arrays = {}
+        for name, column in self.columns.items():
+            if column.dtype in ('int', 'float') and column.nulls is None:
+                arrays[name] = pyarrow.Array.from_buffers(types[column.dtype], len(column), [None, pyarrow.py_buffer(column.values)])
+            else:
+                arrays[name] = pyarrow.array(column.to_list(), type=types.get(column.dtype))
+        return pyarrow.table(arrays)
+
+    def __repr__(self) -> str:
+        return f'Table({len(self)} rows, {self.dtypes})'
+
+
+class TableBuilder:
+    """Collects records into a `Table` one at a time, so the result of a streamed
+    listing is never held as dicts. Nested objects (expanded relations) become
+    dotted columns, except in fields typed `object` (json) which keep the dict.
+
+    Args:
+        dtypes: Column dtypes by field name, see `field_dtypes`. Other columns are `object`
+    """
+
+    def __init__(self, dtypes: dict[str, DType] | None = None) -> None:
+        self.dtypes = dtypes or {}
+        self.keep = {name for name, dtype in self.dtypes.items() if dtype == 'object'}
+        self.columns: dict[str, Column] = {}
+        self.length = 0
+
+    def append(self, row: dict[str, Any]) -> None:
+        columns = self.columns
+        for name, value in _flatten(row, keep=self.keep):
+            if (column := columns.get(name)) is None:
+                column = columns[name] = Column(self.dtypes.get(name, 'object'), self.length)
+            column.append(value)
+        self.length += 1
+        for column in columns.values():
+            if len(column) < self.length:
+                column.append(None)
+
+    def build(self) -> Table:
+        return Table(self.columns, self.length)
+
+
+def to_table(rows: Iterable[dict[str, Any]], dtypes: dict[str, DType] | None = None) -> Table:
+    """Pivot records into a typed `Table`"""
+    builder = TableBuilder(dtypes)
+    for row in rows:
+        builder.append(row)
+    return builder.build()
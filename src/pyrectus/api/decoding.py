@@ -0,0 +1,159 @@
+from __future__ import annotations
+import json
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
+from typing import Any, Literal, get_args, get_origin, is_typeddict
+
+from .records import compact
+
+__all__ = ['Backend', 'Decoder', 'json_decoder', 'struct_for', 'typed_decoder', 'record_decoder', 'precompile']
+
+Backend = Literal['auto', 'orjson', 'msgspec', 'json']
+
+Decoder = Callable[[bytes], Any]
+"""Turns a response body into Python objects"""
+
+_OPEN_SHAPES = {'DirectusItem', 'DirectusSchema'}
+"""Schemas whose keys are user defined, always decoded as plain dicts"""
+
+
+def json_decoder(backend: Backend = 'auto') -> Decoder:
+    """A JSON decoder for the given backend. `auto` picks orjson, then msgspec,
+    then the standard library, depending on what is installed"""
+    if backend in ('auto', 'orjson'):
+        try:
+            import orjson
+            return orjson.loads
+        except ImportError:
+            if backend == 'orjson':
+                raise ImportError('the orjson backend requires orjson, install it with `pip install orjson`') from None
+    if backend in ('auto', 'msgspec'):
+        try:
+            import msgspec
+            return msgspec.json.Decoder().decode
+        except ImportError:
+            if backend == 'msgspec':
+                raise ImportError('the msgspec backend requires msgspec, install it with `pip install msgspec`') from None
+    if backend in ('auto', 'json'):
+        return json.loads
+    raise ValueError(f'Unknown JSON backend {backend!r}')
+
+
+def _msgspec() -> Any:
+    try:
+        import msgspec
+    except ImportError:
+        raise ImportError('typed structs require msgspec, install it with `pip install msgspec`') from None
+    return msgspec
+
+
+@cache
+def _record() -> type:
+    msgspec = _msgspec()
+    unset = msgspec.UNSET
+
+    class Record(msgspec.Struct, kw_only=True, omit_defaults=True, repr_omit_defaults=True, gc=False):
+        """Base of the generated structs. Fields that were not requested are `UNSET`,
+        and mapping style access (`record['id']`, `.get`, `in`) works like the
+        TypedDict it replaces, so pagination and loaders accept either"""
+
+        def __getitem__(self, key: str) -> Any:
+            if (value := getattr(self, key, unset)) is unset:
+                raise KeyError(key)
+            return value
+
+        def get(self, key: str, default: Any = None) -> Any:
+            return value if (value := getattr(self, key, unset)) is not unset else default
+
+        def __contains__(self, key: object) -> bool:
+            return isinstance(key, str) and getattr(self, key, unset) is not unset
+
+        def keys(self) -> Iterator[str]:
+            return (name for name in self.__struct_fields__ if getattr(self, name) is not unset)
+
+        def items(self) -> Iterator[tuple[str, Any]]:
+            return ((name, getattr(self, name)) for name in self.keys())
+
+    return Record
+
+
+@cache
+def struct_for(schema: type) -> type:
+    """A msgspec `Struct` with the fields of a schema TypedDict (requires `msgspec`).
+
+    Fields are untyped, relational fields hold either a key or a nested dict
+    depending on the requested `Fields`. Keys the TypedDict does not declare are
+    skipped while decoding.
+    """
+    msgspec = _msgspec()
+    return msgspec.defstruct(
+        schema.__name__,
+        [(name, Any, msgspec.UNSET) for name in schema.__annotations__],
+        bases=(_record(),),
+        module=__name__,
+        kw_only=True,
+        omit_defaults=True,
+        repr_omit_defaults=True,
+        gc=False,
+    )
+
+
+def _struct_type(hint: Any) -> Any:
+    if is_typeddict(hint):
+        return struct_for(hint) if hint.__name__ not in _OPEN_SHAPES else None
+    if get_origin(hint) is list and (inner := _struct_type(get_args(hint)[0])) is not None:
+        return list[inner]
+    return None
+
+
+@cache
+def _hint(annotation: str) -> Any:
+    """Resolve a `make_endpoint` return annotation against the schema module"""
+    from . import schema
+    try:
+        return eval(annotation, vars(schema))
+    except Exception:
+        return None
+
+
+@cache
+def typed_decoder(annotation: str) -> Decoder | None:
+    """Decoder for a `make_endpoint` return annotation (`'list[DirectusUser]'`) that
+    builds structs straight from the bytes, `None` if the result has no struct form"""
+    if (target := _struct_type(_hint(annotation))) is None:
+        return None
+    msgspec = _msgspec()
+    envelope = msgspec.defstruct('Envelope', [('data', target | None, None)], module=__name__)
+    decode = msgspec.json.Decoder(envelope).decode
+    return lambda content: {'data': decode(content).data}
+
+
+@cache
+def record_decoder(annotation: str, decode: Decoder) -> Decoder | None:
+    """Wrap `decode` to turn the `data` of a response into compact `Record`s of the
+    annotated schema, `None` if the result has no record form"""
+    hint = _hint(annotation)
+    if get_origin(hint) is list:
+        hint = get_args(hint)[0]
+    if not is_typeddict(hint) or hint.__name__ in _OPEN_SHAPES:
+        return None
+
+    def decoder(content: bytes) -> Any:
+        payload = decode(content)
+        if isinstance(payload, dict) and 'data' in payload:
+            payload['data'] = compact(payload['data'], hint)
+        return payload
+    return decoder
+
+
+def precompile(annotations: Iterable[str]) -> int:
+    """Build the struct decoders of `make_endpoint` return annotations ahead of the
+    first request, returning how many have a struct form (requires `msgspec`).
+    `generate_endpoints` lists the annotations of its module in `RETURNS`.
+
+    Example:
+        ```
+        precompile(['list[DirectusUser]', 'DirectusFile'])
+        ```
+    """
+    return sum(typed_decoder(annotation) is not None for annotation in annotations)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+
+__all__ = ['DerivativeCache']
+
+
+class DerivativeCache:
+    """Size bounded on-disk store of rendered asset derivatives (thumbnails, ...).
+
+    Files are named by `Transform.cache_key`, so every request for the same asset
+    and transform maps to one file. The least recently used files are removed once
+    the total size passes `max_bytes`. Existing files are picked up on start.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = 1 << 30) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        found = sorted(
+            (entry.stat().st_mtime, entry.name, entry.stat().st_size)
+            for entry in self.directory.glob('*/*') if not entry.name.endswith('.part')
+        )
+        self._sizes: OrderedDict[str, int] = OrderedDict((name, size) for _, name, size in found)
+        self.size = sum(self._sizes.values())
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Path | None:
+        """Path of a cached derivative, marking it as recently used"""
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.size -= self._sizes.pop(key, 0)
+            return None
+        return path
+
+    def prepare(self, key: str) -> Path:
+        """Path a new derivative should be written to"""
+        path = self.path(key)
+        path.parent.mkdir(exist_ok=True)
+        return path
+
+    def add(self, key: str) -> Path:
+        """Account for a derivative written to `path(key)` and evict past `max_bytes`"""
+        path = self.path(key)
+        size = path.stat().st_size
+        with self._lock:
+            self.size += size - self._sizes.pop(key, 0)
+            self._sizes[key] = size
+            while self.size > self.max_bytes and len(self._sizes) > 1:
+                evicted, evicted_size = self._sizes.popitem(last=False)
+                self.path(evicted).unlink(missing_ok=True)
+                self.size -= evicted_size
+        return path
+
+    def __len__(self) -> int:
+        return len(self._sizes)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+import asyncio
+import os
+from pathlib import Path
+from typing import BinaryIO
+
+from httpx import Response, TransportError
+
+from .transport import AsyncTransport, DirectusError, Transport
+from .upload import DEFAULT_CHUNK_SIZE
+
+__all__ = ['Destination', 'download', 'adownload']
+
+Destination = str | os.PathLike[str] | BinaryIO
+"""A file path, or a writable binary file object / buffer"""
+
+
+class _Target:
+    """Where a download is written, and how far it got.
+
+    A path is written to `<path>.part` and renamed when complete, so an interrupted
+    download leaves a partial file that the next attempt (or process) resumes from.
+    A caller supplied file object is resumed from the bytes already written to it.
+    """
+
+    def __init__(self, destination: Destination, resume: bool) -> None:
+        self.etag: str | None = None
+        if isinstance(destination, (str, os.PathLike)):
+            self.path: Path | None = Path(destination)
+            self.part = self.path.with_name(self.path.name + '.part')
+            self.offset = self.part.stat().st_size if resume and self.part.exists() else 0
+            self.file: BinaryIO = open(self.part, 'ab' if self.offset else 'wb')
+            self.start: int | None = 0
+        else:
+            self.path = None
+            self.file = destination
+            self.offset = 0
+            self.start = destination.tell() if getattr(destination, 'seekable', lambda: False)() else None
+
+    def headers(self) -> dict[str, str]:
+        # Byte ranges must address the stored bytes, not a compressed encoding of them
+        headers = {'Accept-Encoding': 'identity'}
+        if not self.offset:
+            return headers
+        headers['Range'] = f'bytes={self.offset}-'
+        if self.etag:
+            headers['If-Range'] = self.etag
+        return headers
+
+    def begin(self, response: Response) -> None:
+        """Check how the server answered a (possibly ranged) request"""
+        self.etag = response.headers.get('etag', self.etag)
+        if self.offset and response.status_code != 206:
+            # Range ignored or the asset changed (If-Range), start over
+            if self.start is None:
+                raise RuntimeError('Server ignored the Range request and the destination cannot be rewound')
+            self.file.seek(self.start)
+            self.file.truncate()
+            self.offset = 0
+
+    def complete(self, error: DirectusError) -> bool:
+        """A `416` for a range starting at the full size means nothing was left to fetch"""
+        total = error.response.headers.get('content-range', '').rpartition('/')[2]
+        return error.status_code == 416 and total.isdigit() and int(total) == self.offset
+
+    def write(self, chunk: bytes) -> None:
+        self.file.write(chunk)
+        self.offset += len(chunk)
+
+    def finish(self) -> int:
+        if self.path is not None:
+            self.file.close()
+            os.replace(self.part, self.path)
+        return self.offset
+
+    def close(self) -> None:
+        if self.path is not None and not self.file.closed:
+            self.file.close()
+
+
+def download(
+    transport: Transport,
+    url: str,
+    destination: Destination,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    retries: int = 3,
+) -> int:
+    """Stream `url` into `destination` `chunk_size` bytes at a time, returning the
+    number of bytes written.
+
+    On a dropped connection the transfer continues from the last written byte with
+    an HTTP `Range` request (guarded by `If-Range` when the server sent an ETag),
+    up to `retries` times. With `resume`, an existing `<path>.part` is continued.
+    """
+    target = _Target(destination, resume)
+    failures = 0
+    try:
+        while True:
+            try:
+                with transport.stream('GET', url, headers=target.headers()) as response:
+                    target.begin(response)
+                    for chunk in response.iter_bytes(chunk_size):
+                        target.write(chunk)
+                return target.finish()
+            except DirectusError as e:
+                if target.offset and target.complete(e):
+                    return target.finish()
+                raise
+            except TransportError:
+                failures += 1
+                if failures > retries:
+                    raise
+    finally:
+        target.close()
+
+
+async def adownload(
+    transport: AsyncTransport,
+    url: str,
+    destination: Destination,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    retries: int = 3,
+) -> int:
+    """Async counterpart of `download`. Writes run in a worker thread"""
+    target = await asyncio.to_thread(_Target, destination, resume)
+    failures = 0
+    try:
+        while True:
+            try:
+                async with transport.stream('GET', url, headers=target.headers()) as response:
+                    target.begin(response)
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        await asyncio.to_thread(target.write, chunk)
+                return await asyncio.to_thread(target.finish)
+            except DirectusError as e:
+                if target.offset and target.complete(e):
+                    return await asyncio.to_thread(target.finish)
+                raise
+            except TransportError:
+                failures += 1
+                if failures > retries:
+                    raise
+    finally:
+        target.close()
@@ -1,14 +1,19 @@
 from __future__ import annotations
-from collections.abc import Callable
+import json
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import suppress
 from functools import wraps
-from typing import Generic, TypeVar, Unpack
+from inspect import Parameter, signature, Signature
+from pathlib import Path
+from string import Formatter
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import quote
 
-from httpx import Client, AsyncClient, Response, QueryParams
-from urllib.parse import urljoin
+from httpx import Response
 
 from .params import (
     DirectusParameter,
-    Fields,
+    Fields as FieldsParam,
     Filter,
     Search,
     Sort,
@@ -20,33 +25,216 @@ from .params import (
     Deep,
     Alias,
     Export,
+    ExportFormat,
     Version,
     VersionRaw,
     Backlink,
     Meta,
+    Transform,
+    _flatten,
+    compile_params,
 )
-from .schema import *
+from .batch import CHUNK_ERRORS, BatchResult, arun_batches, chunked, run_batches
+from .coalesce import AsyncSingleFlight, SingleFlight
+from .columnar import Columns, DType, Table, TableBuilder, field_dtypes, to_columns, to_numpy, to_table
+from .derivatives import DerivativeCache
+from .download import Destination, adownload, download
+from .export import Sink, aexport, export
+from .pagination import Strategy, apaginate, paginate
+from .sharding import aexport_sharded, export_sharded
+from .snapshot import SNAPSHOT_MAX_AGE, SnapshotCache, SnapshotCheck
+from .streaming import DEFAULT_STREAM_CHUNK, astream_data, stream_data
+from .transport import AsyncTransport, DirectusError, Method, Transport
+from .upload import DEFAULT_CHUNK_SIZE, Source, Upload
+
+if TYPE_CHECKING:
+    from .schema import *
 _S = TypeVar('_S')
 
-        
-def make_endpoint(endpoint: str, method: Literal['GET', 'POST', 'PATCH', 'DELETE'], params: tuple[type[DirectusParameter]]): ...
-        
+
+def __getattr__(name: str) -> Any:
+    # The schema TypedDicts only appear in (string) annotations here, so the
+    # schema module is imported when one is first read from this module
+    from . import schema
+    if name.startswith('Directus') and hasattr(schema, name):
+        return getattr(schema, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+_UPLOAD_ERRORS = (*CHUNK_ERRORS, OSError)
+"""A missing or unreadable source fails its own upload, not the whole batch"""
+_DOWNLOAD_ERRORS = (*CHUNK_ERRORS, OSError, RuntimeError)
+"""Unwritable destinations and failed resumes fail their own download"""
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+
+class EndpointSpec:
+    """Declaration of a single Directus route, built once per decorated method.
+
+    Positional/keyword arguments of the decorated stub that appear in the path
+    template are url-quoted into the path, an argument named `body` is sent as
+    the JSON body, and the variadic argument collects `DirectusParameter`s.
+    """
+
+    def __init__(self, endpoint: str, method: Method, params: tuple[type[DirectusParameter], ...], sig: Signature) -> None:
+        self.endpoint = endpoint
+        self.method = method
+        self.params = params
+        self.signature = sig
+        self.returns = sig.return_annotation if isinstance(sig.return_annotation, str) else None
+        self.path_fields = {name for _, name, _, _ in Formatter().parse(endpoint) if name}
+        self.variadic: str | None = None
+        for name, param in list(sig.parameters.items())[1:]:
+            if param.kind is Parameter.VAR_POSITIONAL:
+                self.variadic = name
+            elif name not in self.path_fields and name != 'body':
+                raise TypeError(f'{endpoint}: argument {name!r} is neither a path field nor `body`')
+        if missing := self.path_fields - set(sig.parameters):
+            raise TypeError(f'{endpoint}: path fields {missing} have no matching argument')
+
+    def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[str, Any]:
+        """Resolve a call into `(url, body)`, where `url` carries the encoded query string"""
+        bound = self.signature.bind(None, *args, **kwargs)
+        arguments = bound.arguments
+        params: tuple[DirectusParameter, ...] = arguments.get(self.variadic, ()) if self.variadic else ()
+        for param in _flatten(params, bound=False):
+            if not isinstance(param, self.params):
+                raise TypeError(f'{self.method} {self.endpoint} does not accept {type(param).__name__}')
+        path = self.endpoint.format_map({name: quote(str(arguments[name]), safe='') for name in self.path_fields})
+        if query := compile_params(params):
+            path = f'{path}?{query}'
+        return path, arguments.get('body')
+
+
+def make_endpoint(endpoint: str, method: Method, params: tuple[type[DirectusParameter], ...] = ()) -> Callable[[_F], _F]:
+    """Turn a typed stub into a request sent through the group's shared `Transport`.
+
+    Example:
+        ```
+        @make_endpoint('/activity/{id}', 'GET', (FieldsParam, Meta))
+        def get_activity(self, id: int, *params: FieldsParam | Meta) -> DirectusActivity: ...
+        ```
+    """
+    def decorator(func: _F) -> _F:
+        spec = EndpointSpec(endpoint, method, params, signature(func))
+
+        @wraps(func)
+        def wrapper(self: _Endpoint, *args: Any, **kwargs: Any) -> Any:
+            url, body = spec.bind(args, kwargs)
+            return self.transport.call(spec.method, url, json=body, returns=spec.returns)
+
+        wrapper.__endpoint__ = spec
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def _make_async_endpoint(stub: Callable[..., Any]) -> Callable[..., Any]:
+    """Build the coroutine version of a `make_endpoint` method from its spec"""
+    spec: EndpointSpec = stub.__endpoint__
+
+    @wraps(stub)
+    async def wrapper(self: _AsyncEndpoint, *args: Any, **kwargs: Any) -> Any:
+        url, body = spec.bind(args, kwargs)
+        return await self.transport.call(spec.method, url, json=body, returns=spec.returns)
+
+    wrapper.__endpoint__ = spec
+    return wrapper
+
+
+def _aggregate_columns(rows: list[dict[str, Any]], params: tuple[DirectusParameter, ...], numpy: bool) -> Columns:
+    aggregates = [p.func for p in _flatten(params) if isinstance(p, Aggregate)]
+    if not aggregates:
+        raise TypeError('aggregate() needs at least one Aggregate')
+    columns = to_columns(rows, numeric=aggregates)
+    return to_numpy(columns) if numpy else columns
+
+
+def _url(path: str, params: tuple[DirectusParameter, ...]) -> str:
+    """`path` with the compiled query of `params`, for requests `make_endpoint` cannot describe"""
+    return f'{path}?{query}' if (query := compile_params(params)) else path
+
+
+def _query_body(filter: Filter, data: dict[str, Any]) -> dict[str, Any]:
+    # `Filter.json` is the only serialization of the tree (dynamic variables included)
+    return {'query': {'filter': json.loads(filter.json)}, 'data': data}
+
 
 class _Endpoint:
-    def __init__(self, client: Client) -> None:
-        self.client = client
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+
+
+class _AsyncEndpoint:
+    """Base for async endpoint groups.
+
+    Subclasses name the sync group they mirror and receive a coroutine method for
+    every `make_endpoint` declaration on it, so both sides share one declaration:
+
+        ```
+        class AsyncActivity(_AsyncEndpoint, mirror=Activity): ...
+        ```
+    """
+    mirror: type[_Endpoint]
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        self.transport = transport
+
+    def __init_subclass__(cls, mirror: type[_Endpoint], **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.mirror = mirror
+        for klass in reversed(mirror.__mro__):
+            for name, attr in vars(klass).items():
+                if hasattr(attr, '__endpoint__') and name not in cls.__dict__:
+                    setattr(cls, name, _make_async_endpoint(attr))
     
 class Activity(_Endpoint):
     
-    @make_endpoint('/activity/{id}', 'GET', (Fields, Meta))
-    def get_activity(self, id: int, *parms: Fields | Meta) -> DirectusActivity: ...
+    @make_endpoint('/activity/{id}', 'GET', (FieldsParam, Meta))
+    def get_activity(self, id: int, *params: FieldsParam | Meta) -> DirectusActivity: ...
+    
+    @make_endpoint('/activity', 'GET', (FieldsParam, Limit, Meta, Offset, Sort, Filter, Search))
+    def get_activities(self, *params: FieldsParam | Limit | Meta | Offset | Sort | Filter | Search) -> list[DirectusActivity]: ...
+    
+    def iter_activities(self, *params: FieldsParam | Limit | Offset | Sort | Filter | Search, page_size: int = 100, strategy: Strategy = 'offset') -> Iterator[DirectusActivity]:
+        """Stream `get_activities` page by page, see `paginate`"""
+        return paginate(self.get_activities, *params, page_size=page_size, strategy=strategy)
     
-    @make_endpoint('/activity', 'GET', (Fields, Limit, Meta, Offset, Sort, Filter, Search))
-    def get_activities(self, *params: Fields | Limit | Meta | Offset | Sort | Filter | Search) -> list[DirectusActivity]: ...
+    def stream_activities(self, *params: FieldsParam | Limit | Offset | Sort | Filter | Search, chunk_size: int = DEFAULT_STREAM_CHUNK) -> Iterator[DirectusActivity]:
+        """Yield activities from one request as they are parsed off the wire, see `DataParser`"""
+        return stream_data(self.transport, _url('/activity', params), chunk_size)
 
 class Assets(_Endpoint):
-    def get_asset() -> Response: ...
     
+    def __init__(self, transport: Transport) -> None:
+        super().__init__(transport)
+        self._renders = SingleFlight()
+    
+    def get_asset(self, id: str, *params: Transform) -> Response:
+        """The asset response with its body read into memory, prefer `download` for large files"""
+        return self.transport.request('GET', _url(f'/assets/{quote(id, safe="")}', params))
+    
+    def download(self, id: str, destination: Destination, *params: Transform, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True, retries: int = 3) -> int:
+        """Stream an asset to a path or writable file object, resuming with `Range` on
+        dropped connections. Returns the number of bytes written, see `download`"""
+        return download(self.transport, _url(f'/assets/{quote(id, safe="")}', params), destination, chunk_size=chunk_size, resume=resume, retries=retries)
+    
+    def download_many(self, assets: Iterable[tuple[str, Destination]], *params: Transform, max_workers: int = 4, chunk_size: int = DEFAULT_CHUNK_SIZE, retries: int = 3) -> BatchResult:
+        """Download `(id, destination)` pairs with at most `max_workers` transfers at once"""
+        return run_batches(lambda chunk: self.download(*chunk[0], *params, chunk_size=chunk_size, retries=retries), chunked(assets, 1), max_workers, _DOWNLOAD_ERRORS)
+    
+    def derivative(self, id: str, transform: Transform, cache: DerivativeCache) -> Path:
+        """Path of asset `id` rendered with `transform`, fetched once into `cache`
+        
+        Concurrent requests for the same derivative wait on a single fetch.
+        """
+        key = transform.cache_key(id)
+        if (path := cache.get(key)) is not None:
+            return path
+        return self._renders.do(key, lambda: cache.get(key) or self._render(id, transform, cache, key))
+    
+    def _render(self, id: str, transform: Transform, cache: DerivativeCache, key: str) -> Path:
+        self.download(id, cache.prepare(key), transform, resume=False)
+        return cache.add(key)
+
 class Auth(_Endpoint): ...
 
 class Collections(_Endpoint): ...
@@ -57,13 +245,140 @@ class Dashboards(_Endpoint): ...
 
 class Extensions(_Endpoint): ...
 
-class Fields(_Endpoint): ...
+class Fields(_Endpoint):
+    
+    @make_endpoint('/fields/{collection}', 'GET')
+    def get_collection_fields(self, collection: str) -> list[dict[str, Any]]:
+        """Fields of `collection` as `{collection, field, type, meta, schema}`, readable
+        by any role with access to the collection (unlike `/schema/snapshot`)"""
 
-class Files(_Endpoint): ...
+class Files(_Endpoint):
+    
+    @make_endpoint('/files/{id}', 'GET', (FieldsParam, Meta))
+    def get_file(self, id: str, *params: FieldsParam | Meta) -> DirectusFile: ...
+    
+    @make_endpoint('/files', 'GET', (FieldsParam, Limit, Meta, Offset, Page, Sort, Filter, Search))
+    def get_files(self, *params: FieldsParam | Limit | Meta | Offset | Page | Sort | Filter | Search) -> list[DirectusFile]: ...
+    
+    @make_endpoint('/files/{id}', 'PATCH', (FieldsParam,))
+    def update_file(self, id: str, body: dict[str, Any], *params: FieldsParam) -> DirectusFile: ...
+    
+    @make_endpoint('/files/{id}', 'DELETE')
+    def delete_file(self, id: str) -> None: ...
+    
+    @make_endpoint('/files/import', 'POST', (FieldsParam,))
+    def import_file(self, body: dict[str, Any], *params: FieldsParam) -> DirectusFile:
+        """Have Directus download a file from `{"url": ..., "data": {...}}`"""
+    
+    def upload(self, source: Source | Upload, *params: FieldsParam, filename: str | None = None, content_type: str | None = None, data: dict[str, Any] | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> DirectusFile:
+        """Upload a file, streamed from disk (or any `Source`) `chunk_size` bytes at a time"""
+        upload = Upload.of(source, filename=filename, content_type=content_type, data=data, chunk_size=chunk_size)
+        return self.transport.call('POST', _url('/files', params), content=iter(upload), headers=upload.headers)
+    
+    def replace(self, id: str, source: Source | Upload, *params: FieldsParam, filename: str | None = None, content_type: str | None = None, data: dict[str, Any] | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> DirectusFile:
+        """Replace the contents of an existing file, streamed like `upload`"""
+        upload = Upload.of(source, filename=filename, content_type=content_type, data=data, chunk_size=chunk_size)
+        return self.transport.call('PATCH', _url(f'/files/{quote(id, safe="")}', params), content=iter(upload), headers=upload.headers)
+    
+    def upload_many(self, sources: Iterable[Source | Upload], *params: FieldsParam, max_workers: int = 4) -> BatchResult:
+        """Upload files concurrently, one per request. Each `ChunkResult` holds one upload"""
+        return run_batches(lambda chunk: self.upload(chunk[0], *params), chunked(sources, 1), max_workers, _UPLOAD_ERRORS)
 
 class Folders(_Endpoint): ...
 
-class Items(_Endpoint): ...
+class Items(_Endpoint):
+    
+    @make_endpoint('/items/{collection}/{id}', 'GET', (FieldsParam, Meta, Deep, Version, VersionRaw, Backlink))
+    def get_item(self, collection: str, id: int | str, *params: FieldsParam | Meta | Deep | Version | VersionRaw | Backlink) -> DirectusItem: ...
+    
+    @make_endpoint('/items/{collection}', 'GET', (FieldsParam, Limit, Meta, Offset, Page, Sort, Filter, Search, Aggregate, GroupBy, Deep, Alias, Version, VersionRaw, Backlink))
+    def get_items(self, collection: str, *params: FieldsParam | Limit | Meta | Offset | Page | Sort | Filter | Search | Aggregate | GroupBy | Deep | Alias | Version | VersionRaw | Backlink) -> list[DirectusItem]: ...
+    
+    def iter_items(self, collection: str, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version | Backlink, page_size: int = 100, strategy: Strategy = 'offset') -> Iterator[DirectusItem]:
+        """Stream `get_items` page by page, see `paginate`"""
+        return paginate(self.get_items, collection, *params, page_size=page_size, strategy=strategy)
+    
+    def stream_items(self, collection: str, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version | Backlink, chunk_size: int = DEFAULT_STREAM_CHUNK) -> Iterator[DirectusItem]:
+        """Yield items from one request as they are parsed off the wire, so a large
+        `Limit` never holds the whole body in memory, see `DataParser`"""
+        return stream_data(self.transport, _url(f'/items/{quote(collection, safe="")}', params), chunk_size)
+    
+    def export(self, collection: str, destination: Sink, format: ExportFormat, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version, page_size: int | None = None, key: str = 'id', chunk_size: int = DEFAULT_STREAM_CHUNK) -> int:
+        """Stream a server rendered csv/json/xml/yaml export to a path, file or callback
+        without decoding it. With `page_size` the export is fetched in key ranges of
+        about `page_size` items, joined into one document. Returns the bytes written,
+        see `export`
+        
+        Example:
+            ```
+            items.export('orders', 'orders.csv', 'csv', Fields('id', 'total'), page_size=50_000)
+            ```
+        """
+        return export(self.transport, f'/items/{quote(collection, safe="")}', lambda *scope: self.get_items(collection, *scope), destination, format, params, page_size=page_size, key=key, chunk_size=chunk_size)
+    
+    def table(self, collection: str, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version, dtypes: dict[str, DType] | None = None, chunk_size: int = DEFAULT_STREAM_CHUNK) -> Table:
+        """Load items into typed columns as the response streams in, see `Table`
+        
+        Column dtypes come from `/fields/{collection}` (kept by a transport's
+        `ResponseCache` for its `fields` TTL) unless `dtypes` is given. Pass
+        `Limit(-1)` for the whole collection.
+        """
+        if dtypes is None:
+            dtypes = field_dtypes(Fields(self.transport).get_collection_fields(collection), collection)
+        return to_table(self.stream_items(collection, *params, chunk_size=chunk_size), dtypes)
+    
+    def export_sharded(self, collection: str, *params: FieldsParam | Filter | Search | Deep | Alias | Version | Backlink, max_workers: int = 8, shards: int | None = None, page_size: int = 1000, key: str = 'id') -> Iterator[DirectusItem]:
+        """Export a collection with concurrent key-range shards, see `export_sharded`"""
+        return export_sharded(self.get_items, collection, *params, max_workers=max_workers, shards=shards, page_size=page_size, key=key)
+    
+    def aggregate(self, collection: str, *params: Aggregate | GroupBy | Filter | Search | Sort | Limit, numpy: bool = False) -> Columns:
+        """Run `Aggregate`/`GroupBy` server side and return the result as columns
+        
+        Example:
+            ```
+            items.aggregate('orders', Aggregate('sum', 'total'), Aggregate('count', '*'), GroupBy('country'))
+            # {'country': ['NL', 'US'], 'sum.total': [120.5, 87.0], 'count': [3, 2]}
+            ```
+        """
+        return _aggregate_columns(self.get_items(collection, *params), params, numpy)
+    
+    @make_endpoint('/items/{collection}', 'POST', (FieldsParam,))
+    def create_item(self, collection: str, body: dict[str, Any], *params: FieldsParam) -> DirectusItem: ...
+    
+    @make_endpoint('/items/{collection}', 'POST', (FieldsParam,))
+    def create_items(self, collection: str, body: list[dict[str, Any]], *params: FieldsParam) -> list[DirectusItem]: ...
+    
+    @make_endpoint('/items/{collection}/{id}', 'PATCH', (FieldsParam,))
+    def update_item(self, collection: str, id: int | str, body: dict[str, Any], *params: FieldsParam) -> DirectusItem: ...
+    
+    @make_endpoint('/items/{collection}', 'PATCH', (FieldsParam,))
+    def update_items(self, collection: str, body: list[dict[str, Any]] | dict[str, Any], *params: FieldsParam) -> list[DirectusItem]:
+        """Update a list of partial items (each with its key), or `{"keys": [...], "data": {...}}`
+        or `{"query": {...}, "data": {...}}`"""
+    
+    @make_endpoint('/items/{collection}/{id}', 'DELETE')
+    def delete_item(self, collection: str, id: int | str) -> None: ...
+    
+    @make_endpoint('/items/{collection}', 'DELETE')
+    def delete_items(self, collection: str, body: list[int | str] | dict[str, Any]) -> None:
+        """Delete a list of keys, or `{"query": {...}}`"""
+    
+    def create_many(self, collection: str, items: Iterable[dict[str, Any]], *params: FieldsParam, chunk_size: int = 500, max_bytes: int | None = None, max_workers: int = 4) -> BatchResult:
+        """Create items in chunks of at most `chunk_size` items (and `max_bytes` of JSON),
+        sending up to `max_workers` chunks at once. Failed chunks are reported, not raised"""
+        return run_batches(lambda chunk: self.create_items(collection, chunk, *params), chunked(items, chunk_size, max_bytes), max_workers)
+    
+    def update_many(self, collection: str, items: Iterable[dict[str, Any]], *params: FieldsParam, chunk_size: int = 500, max_bytes: int | None = None, max_workers: int = 4) -> BatchResult:
+        """Update partial items, each carrying its primary key, in concurrent chunks"""
+        return run_batches(lambda chunk: self.update_items(collection, chunk, *params), chunked(items, chunk_size, max_bytes), max_workers)
+    
+    def update_by_query(self, collection: str, filter: Filter, data: dict[str, Any], *params: FieldsParam) -> list[DirectusItem]:
+        """Apply the same `data` to every item matching `filter` in one request"""
+        return self.update_items(collection, _query_body(filter, data), *params)
+    
+    def delete_many(self, collection: str, keys: Iterable[int | str], *, chunk_size: int = 1000, max_workers: int = 4) -> BatchResult:
+        """Delete items by key in concurrent chunks"""
+        return run_batches(lambda chunk: self.delete_items(collection, chunk), chunked(keys, chunk_size), max_workers)
 
 class Metrics(_Endpoint): ...
 
@@ -81,11 +396,47 @@ class Presets(_Endpoint): ...
 
 class Relations(_Endpoint): ...
 
-class Revisions(_Endpoint): ...
+class Revisions(_Endpoint):
+    
+    @make_endpoint('/revisions/{id}', 'GET', (FieldsParam, Meta))
+    def get_revision(self, id: int, *params: FieldsParam | Meta) -> DirectusRevision: ...
+    
+    @make_endpoint('/revisions', 'GET', (FieldsParam, Limit, Meta, Offset, Page, Sort, Filter, Search))
+    def get_revisions(self, *params: FieldsParam | Limit | Meta | Offset | Page | Sort | Filter | Search) -> list[DirectusRevision]: ...
+    
+    def iter_revisions(self, *params: FieldsParam | Limit | Offset | Sort | Filter | Search, page_size: int = 100, strategy: Strategy = 'offset') -> Iterator[DirectusRevision]:
+        """Stream `get_revisions` page by page, see `paginate`"""
+        return paginate(self.get_revisions, *params, page_size=page_size, strategy=strategy)
 
 class Roles(_Endpoint): ...
 
-class Schema(_Endpoint): ...
+class Schema(_Endpoint):
+    
+    @make_endpoint('/schema/snapshot', 'GET')
+    def get_snapshot(self) -> DirectusSchema: ...
+    
+    @make_endpoint('/schema/diff', 'POST')
+    def diff(self, body: DirectusSchema) -> DirectusDiff | None:
+        """Difference between `body` and the live schema, `None` when they match"""
+    
+    @make_endpoint('/schema/apply', 'POST')
+    def apply(self, body: DirectusDiff) -> None: ...
+    
+    def cached_snapshot(self, cache: SnapshotCache | None = None, max_age: float = SNAPSHOT_MAX_AGE) -> DirectusSchema:
+        """Schema snapshot from the local cache, refetched only when the schema changed
+        
+        A cached snapshot confirmed less than `max_age` seconds ago is returned without
+        any request, so workers starting together share one fetch. An older one is
+        checked with `/schema/diff` and the full snapshot is only downloaded again when
+        the server reports a difference or rejects the diff (e.g. after an upgrade).
+        """
+        check = SnapshotCheck(cache or SnapshotCache(self.transport.url), max_age)
+        if check.stale:
+            with suppress(DirectusError):
+                check.diffed(self.diff(check.snapshot))
+        if (snapshot := check.result()) is not None:
+            return snapshot
+        return check.fetched(self.get_snapshot())
 
 class Server(_Endpoint): ...
 
@@ -99,4 +450,154 @@ class Users(_Endpoint): ...
 
 class Utils(_Endpoint): ...
 
-class Versions(_Endpoint): ...
\ No newline at end of file
+class Versions(_Endpoint): ...
+
+
+# Async mirrors, generated from the sync declarations above
+
+class AsyncActivity(_AsyncEndpoint, mirror=Activity):
+    
+    def iter_activities(self, *params: FieldsParam | Limit | Offset | Sort | Filter | Search, page_size: int = 100, strategy: Strategy = 'offset') -> AsyncIterator[DirectusActivity]:
+        return apaginate(self.get_activities, *params, page_size=page_size, strategy=strategy)
+    
+    def stream_activities(self, *params: FieldsParam | Limit | Offset | Sort | Filter | Search, chunk_size: int = DEFAULT_STREAM_CHUNK) -> AsyncIterator[DirectusActivity]:
+        return astream_data(self.transport, _url('/activity', params), chunk_size)
+
+class AsyncAssets(_AsyncEndpoint, mirror=Assets):
+    
+    def __init__(self, transport: AsyncTransport) -> None:
+        super().__init__(transport)
+        self._renders = AsyncSingleFlight()
+    
+    async def get_asset(self, id: str, *params: Transform) -> Response:
+        return await self.transport.request('GET', _url(f'/assets/{quote(id, safe="")}', params))
+    
+    async def download(self, id: str, destination: Destination, *params: Transform, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True, retries: int = 3) -> int:
+        return await adownload(self.transport, _url(f'/assets/{quote(id, safe="")}', params), destination, chunk_size=chunk_size, resume=resume, retries=retries)
+    
+    async def download_many(self, assets: Iterable[tuple[str, Destination]], *params: Transform, max_workers: int = 4, chunk_size: int = DEFAULT_CHUNK_SIZE, retries: int = 3) -> BatchResult:
+        return await arun_batches(lambda chunk: self.download(*chunk[0], *params, chunk_size=chunk_size, retries=retries), chunked(assets, 1), max_workers, _DOWNLOAD_ERRORS)
+    
+    async def derivative(self, id: str, transform: Transform, cache: DerivativeCache) -> Path:
+        key = transform.cache_key(id)
+        if (path := cache.get(key)) is not None:
+            return path
+        return await self._renders.do(key, lambda: self._render(id, transform, cache, key))
+    
+    async def _render(self, id: str, transform: Transform, cache: DerivativeCache, key: str) -> Path:
+        if (path := cache.get(key)) is not None:
+            return path
+        await self.download(id, cache.prepare(key), transform, resume=False)
+        return cache.add(key)
+
+class AsyncAuth(_AsyncEndpoint, mirror=Auth): ...
+
+class AsyncCollections(_AsyncEndpoint, mirror=Collections): ...
+
+class AsyncComments(_AsyncEndpoint, mirror=Comments): ...
+
+class AsyncDashboards(_AsyncEndpoint, mirror=Dashboards): ...
+
+class AsyncExtensions(_AsyncEndpoint, mirror=Extensions): ...
+
+class AsyncFields(_AsyncEndpoint, mirror=Fields): ...
+
+class AsyncFiles(_AsyncEndpoint, mirror=Files):
+    
+    async def upload(self, source: Source | Upload, *params: FieldsParam, filename: str | None = None, content_type: str | None = None, data: dict[str, Any] | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> DirectusFile:
+        upload = Upload.of(source, filename=filename, content_type=content_type, data=data, chunk_size=chunk_size)
+        return await self.transport.call('POST', _url('/files', params), content=aiter(upload), headers=upload.headers)
+    
+    async def replace(self, id: str, source: Source | Upload, *params: FieldsParam, filename: str | None = None, content_type: str | None = None, data: dict[str, Any] | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> DirectusFile:
+        upload = Upload.of(source, filename=filename, content_type=content_type, data=data, chunk_size=chunk_size)
+        return await self.transport.call('PATCH', _url(f'/files/{quote(id, safe="")}', params), content=aiter(upload), headers=upload.headers)
+    
+    async def upload_many(self, sources: Iterable[Source | Upload], *params: FieldsParam, max_workers: int = 4) -> BatchResult:
+        return await arun_batches(lambda chunk: self.upload(chunk[0], *params), chunked(sources, 1), max_workers, _UPLOAD_ERRORS)
+
+class AsyncFolders(_AsyncEndpoint, mirror=Folders): ...
+
+class AsyncItems(_AsyncEndpoint, mirror=Items):
+    
+    def iter_items(self, collection: str, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version | Backlink, page_size: int = 100, strategy: Strategy = 'offset') -> AsyncIterator[DirectusItem]:
+        return apaginate(self.get_items, collection, *params, page_size=page_size, strategy=strategy)
+    
+    def stream_items(self, collection: str, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version | Backlink, chunk_size: int = DEFAULT_STREAM_CHUNK) -> AsyncIterator[DirectusItem]:
+        return astream_data(self.transport, _url(f'/items/{quote(collection, safe="")}', params), chunk_size)
+    
+    async def export(self, collection: str, destination: Sink, format: ExportFormat, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version, page_size: int | None = None, key: str = 'id', chunk_size: int = DEFAULT_STREAM_CHUNK) -> int:
+        return await aexport(self.transport, f'/items/{quote(collection, safe="")}', lambda *scope: self.get_items(collection, *scope), destination, format, params, page_size=page_size, key=key, chunk_size=chunk_size)
+    
+    async def table(self, collection: str, *params: FieldsParam | Limit | Offset | Sort | Filter | Search | Deep | Alias | Version, dtypes: dict[str, DType] | None = None, chunk_size: int = DEFAULT_STREAM_CHUNK) -> Table:
+        if dtypes is None:
+            dtypes = field_dtypes(await AsyncFields(self.transport).get_collection_fields(collection), collection)
+        builder = TableBuilder(dtypes)
+        async for row in self.stream_items(collection, *params, chunk_size=chunk_size):
+            builder.append(row)
+        return builder.build()
+    
+    def export_sharded(self, collection: str, *params: FieldsParam | Filter | Search | Deep | Alias | Version | Backlink, max_workers: int = 8, shards: int | None = None, page_size: int = 1000, key: str = 'id') -> AsyncIterator[DirectusItem]:
+        return aexport_sharded(self.get_items, collection, *params, max_workers=max_workers, shards=shards, page_size=page_size, key=key)
+    
+    async def aggregate(self, collection: str, *params: Aggregate | GroupBy | Filter | Search | Sort | Limit, numpy: bool = False) -> Columns:
+        return _aggregate_columns(await self.get_items(collection, *params), params, numpy)
+    
+    async def create_many(self, collection: str, items: Iterable[dict[str, Any]], *params: FieldsParam, chunk_size: int = 500, max_bytes: int | None = None, max_workers: int = 4) -> BatchResult:
+        return await arun_batches(lambda chunk: self.create_items(collection, chunk, *params), chunked(items, chunk_size, max_bytes), max_workers)
+    
+    async def update_many(self, collection: str, items: Iterable[dict[str, Any]], *params: FieldsParam, chunk_size: int = 500, max_bytes: int | None = None, max_workers: int = 4) -> BatchResult:
+        return await arun_batches(lambda chunk: self.update_items(collection, chunk, *params), chunked(items, chunk_size, max_bytes), max_workers)
+    
+    async def update_by_query(self, collection: str, filter: Filter, data: dict[str, Any], *params: FieldsParam) -> list[DirectusItem]:
+        return await self.update_items(collection, _query_body(filter, data), *params)
+    
+    async def delete_many(self, collection: str, keys: Iterable[int | str], *, chunk_size: int = 1000, max_workers: int = 4) -> BatchResult:
+        return await arun_batches(lambda chunk: self.delete_items(collection, chunk), chunked(keys, chunk_size), max_workers)
+
+class AsyncMetrics(_AsyncEndpoint, mirror=Metrics): ...
+
+class AsyncNotifications(_AsyncEndpoint, mirror=Notifications): ...
+
+class AsyncOperations(_AsyncEndpoint, mirror=Operations): ...
+
+class AsyncPanels(_AsyncEndpoint, mirror=Panels): ...
+
+class AsyncPermissions(_AsyncEndpoint, mirror=Permissions): ...
+
+class AsyncPolicies(_AsyncEndpoint, mirror=Policies): ...
+
+class AsyncPresets(_AsyncEndpoint, mirror=Presets): ...
+
+class AsyncRelations(_AsyncEndpoint, mirror=Relations): ...
+
+class AsyncRevisions(_AsyncEndpoint, mirror=Revisions):
+    
+    def iter_revisions(self, *params: FieldsParam | Limit | Offset | Sort | Filter | Search, page_size: int = 100, strategy: Strategy = 'offset') -> AsyncIterator[DirectusRevision]:
+        return apaginate(self.get_revisions, *params, page_size=page_size, strategy=strategy)
+
+class AsyncRoles(_AsyncEndpoint, mirror=Roles): ...
+
+class AsyncSchema(_AsyncEndpoint, mirror=Schema):
+    
+    async def cached_snapshot(self, cache: SnapshotCache | None = None, max_age: float = SNAPSHOT_MAX_AGE) -> DirectusSchema:
+        check = SnapshotCheck(cache or SnapshotCache(self.transport.url), max_age)
+        if check.stale:
+            with suppress(DirectusError):
+                check.diffed(await self.diff(check.snapshot))
+        if (snapshot := check.result()) is not None:
+            return snapshot
+        return check.fetched(await self.get_snapshot())
+
+class AsyncServer(_AsyncEndpoint, mirror=Server): ...
+
+class AsyncSettings(_AsyncEndpoint, mirror=Settings): ...
+
+class AsyncShares(_AsyncEndpoint, mirror=Shares): ...
+
+class AsyncTranslations(_AsyncEndpoint, mirror=Translations): ...
+
+class AsyncUsers(_AsyncEndpoint, mirror=Users): ...
+
+class AsyncUtils(_AsyncEndpoint, mirror=Utils): ...
+
+class AsyncVersions(_AsyncEndpoint, mirror=Versions): ...
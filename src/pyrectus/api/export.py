@@ -0,0 +1,240 @@
+from __future__ import annotations
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+from math import ceil
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from .params import DirectusParameter, Export, ExportFormat, Limit, Sort, _flatten, compile_params
+from .sharding import _stats_params, plan_shards
+from .streaming import DEFAULT_STREAM_CHUNK
+from .transport import AsyncTransport, Transport
+
+__all__ = ['Sink', 'plan_pages', 'export', 'aexport']
+
+Sink = str | os.PathLike[str] | BinaryIO | Callable[[bytes], Any]
+"""A file path, a writable binary file object, or a callback receiving each chunk"""
+
+
+class _Format(NamedTuple):
+    head: bytes | None
+    """Ends the preamble, kept from the first page that has one"""
+    tail: bytes | None
+    """Starts the closing part of every page, dropped before the last page"""
+    separator: bytes
+    """Written between the records of two pages"""
+    strip: bytes
+    """Trailing characters removed before a page is joined to the next"""
+    empty: bytes | None
+    """Start of a page body without records, `None` when such a body is blank"""
+
+
+_FORMATS: dict[str, _Format] = {
+    'csv': _Format(b'\n', None, b'\n', b'\r\n', None),
+    'json': _Format(b'[', b']', b',', b' \t\r\n', b']'),
+    'xml': _Format(b'<data>', b'</data>', b'\n', b' \t\r\n', b'</data>'),
+    'yaml': _Format(None, None, b'\n', b' \t\r\n', b'[]'),
+}
+
+
+class _Joiner:
+    """Writes the export of consecutive pages as one document.
+
+    Each page is a complete file (csv header, json array, xml root), so the
+    preamble of later pages and the closing part of earlier pages are cut while
+    the chunks pass through. Pages without records (empty key ranges) add nothing
+    but the closing part of the last page, and the separator is only written
+    between records. Only the last `window` bytes of a page are held back.
+    """
+    window = 1024
+
+    def __init__(self, format: ExportFormat, write: Callable[[bytes], Any]) -> None:
+        self.format = _FORMATS[format]
+        self.write = write
+        self.opened = False  # a preamble was written
+        self.records = False  # records of an earlier page were written
+
+    def begin(self, last: bool) -> None:
+        self.last = last
+        self.pending = b''
+        self.preamble = self.format.head is not None
+        self.body: bool | None = None  # whether the page has records, None until known
+
+    def _has_records(self, body: bytes) -> bool | None:
+        body = body.lstrip(self.format.strip)
+        if not body:
+            return None
+        if (empty := self.format.empty) is None:
+            return True
+        if body.startswith(empty):
+            return False
+        return None if empty.startswith(body) else True
+
+    def _start(self, records: bool) -> None:
+        self.body = records
+        if records:
+            if self.records:
+                self.write(self.format.separator)
+            self.records = True
+
+    def feed(self, chunk: bytes) -> None:
+        self.pending += chunk
+        if self.preamble:
+            assert self.format.head is not None
+            if (end := self.pending.find(self.format.head)) < 0:
+                return
+            end += len(self.format.head)
+            if self.opened:
+                self.pending = self.pending[end:].lstrip(b'\r\n')
+            else:
+                self.write(self.pending[:end])
+                self.pending = self.pending[end:]
+                self.opened = True
+            self.preamble = False
+        if self.body is None:
+            if (records := self._has_records(self.pending)) is None:
+                return
+            self._start(records)
+        if not self.body:
+            return
+        if self.last:
+            self.write(self.pending)
+            self.pending = b''
+        elif len(self.pending) > self.window:
+            self.write(self.pending[:-self.window])
+            self.pending = self.pending[-self.window:]
+
+    def end(self) -> None:
+        pending = self.pending
+        if self.preamble:
+            # No head at all (e.g. `<data/>`): a whole document if nothing was opened yet
+            if self.last:
+                self.write(pending if not self.opened else self.format.tail or b'')
+        else:
+            if self.body is None:
+                self._start(bool(self._has_records(pending)))
+            if self.body:
+                if not self.last:
+                    pending = pending.rstrip(self.format.strip)
+                    if self.format.tail and (cut := pending.rfind(self.format.tail)) >= 0:
+                        pending = pending[:cut].rstrip(self.format.strip)
+                self.write(pending)
+            elif self.last and (self.format.tail is not None or not self.records):
+                self.write(pending)
+
+
+class _Output:
+    """A path is written to `<path>.part` and renamed once the export is complete"""
+
+    def __init__(self, destination: Sink) -> None:
+        self.path: Path | None = None
+        self.file: BinaryIO | None = None
+        self.written = 0
+        if isinstance(destination, (str, os.PathLike)):
+            self.path = Path(destination)
+            self.part = self.path.with_name(self.path.name + '.part')
+            self.file = open(self.part, 'wb')
+            self.sink: Callable[[bytes], Any] = self.file.write
+        elif callable(destination):
+            self.sink = destination
+        else:
+            self.sink = destination.write
+
+    def write(self, data: bytes) -> None:
+        self.sink(data)
+        self.written += len(data)
+
+    def finish(self) -> int:
+        if self.file is not None:
+            self.file.close()
+            os.replace(self.part, self.path)  # type: ignore[arg-type]
+        return self.written
+
+    def close(self) -> None:
+        if self.file is not None and not self.file.closed:
+            self.file.close()
+            self.part.unlink(missing_ok=True)
+
+
+def plan_pages(params: tuple[DirectusParameter, ...], page_size: int | None, key: str, stats: list[dict[str, Any]] | None) -> list[tuple[DirectusParameter, ...]]:
+    """Params of each export request. Without `page_size` the export is a single
+    request, otherwise the matching items are split into key ranges of about
+    `page_size` items from their `count`/`min`/`max` `stats` (see `plan_shards`),
+    each exported sorted by `key`. Ranges are filtered by key, so a page costs
+    the same wherever it lies in the collection"""
+    params = tuple(_flatten(params))
+    if page_size is None or stats is None:
+        return [params if any(isinstance(p, Limit) for p in params) else (*params, Limit(-1))]
+    count = int(stats[0].get('count') or 0) if stats else 0
+    shards, keyset = plan_shards(stats, key, ceil(count / page_size), page_size)
+    if not shards:
+        return [(*params, Limit(0))]
+    if not keyset:
+        return [(*params, *shard) for shard in shards]
+    return [(*params, *shard, Sort(key), Limit(-1)) for shard in shards]
+
+
+def export(
+    transport: Transport,
+    path: str,
+    query: Callable[..., list[dict[str, Any]]],
+    destination: Sink,
+    format: ExportFormat,
+    params: tuple[DirectusParameter, ...],
+    *,
+    page_size: int | None = None,
+    key: str = 'id',
+    chunk_size: int = DEFAULT_STREAM_CHUNK,
+) -> int:
+    """Stream a server side export of `path` to `destination`, returning the bytes written.
+
+    With `page_size` the count and key range of the matching items are read through
+    `query` (the JSON list endpoint) and the export is fetched one key range at a
+    time, joined into one document. `Limit`, `Offset` and `Sort` are then managed by
+    the export and raise `ValueError`. Pass `Fields` for exports over several pages,
+    so every CSV page has the same columns.
+    """
+    stats = query(*_stats_params(key, params)) if page_size is not None else None
+    pages = plan_pages(params, page_size, key, stats)
+    output = _Output(destination)
+    joiner = _Joiner(format, output.write)
+    try:
+        for n, page in enumerate(pages):
+            joiner.begin(last=n == len(pages) - 1)
+            with transport.stream('GET', f'{path}?{compile_params((*page, Export(format)))}') as response:
+                for chunk in response.iter_bytes(chunk_size):
+                    joiner.feed(chunk)
+            joiner.end()
+        return output.finish()
+    finally:
+        output.close()
+
+
+async def aexport(
+    transport: AsyncTransport,
+    path: str,
+    query: Callable[..., Awaitable[list[dict[str, Any]]]],
+    destination: Sink,
+    format: ExportFormat,
+    params: tuple[DirectusParameter, ...],
+    *,
+    page_size: int | None = None,
+    key: str = 'id',
+    chunk_size: int = DEFAULT_STREAM_CHUNK,
+) -> int:
+    """Async counterpart of `export`. File writes run in a worker thread"""
+    stats = await query(*_stats_params(key, params)) if page_size is not None else None
+    pages = plan_pages(params, page_size, key, stats)
+    output = await asyncio.to_thread(_Output, destination)
+    joiner = _Joiner(format, output.write)
+    try:
+        for n, page in enumerate(pages):
+            joiner.begin(last=n == len(pages) - 1)
+            async with transport.stream('GET', f'{path}?{compile_params((*page, Export(format)))}') as response:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await asyncio.to_thread(joiner.feed, chunk)
+            joiner.end()
+        return await asyncio.to_thread(output.finish)
+    finally:
+        output.close()
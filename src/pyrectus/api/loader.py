@@ -0,0 +1,187 @@
+from __future__ import annotations
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, Generic, TypeVar
+
+from .batch import chunked
+from .pagination import _split
+from .params import DirectusParameter, Fields, Filter, Limit, _flatten
+
+__all__ = ['Loader', 'AsyncLoader']
+
+_T = TypeVar('_T')
+
+
+def _batch_params(params: tuple[DirectusParameter, ...], key: str) -> tuple[tuple[DirectusParameter, ...], Filter | None]:
+    """`(params, filter)` with the caller's filters combined into one, to be joined
+    with the `_in` filter of each batch. The key is kept in any `Fields` projection,
+    records are matched to ids by it"""
+    rest: list[DirectusParameter] = []
+    where: Filter | None = None
+    for param in _flatten(params):
+        if isinstance(param, Filter):
+            where = param if where is None else where & param
+        elif isinstance(param, Fields) and not param.covers(key):
+            rest.append(param + Fields(key))
+        elif not isinstance(param, Limit):
+            rest.append(param)
+    return tuple(rest), where
+
+
+def _batch_filter(where: Filter | None, key: str, ids: list[Hashable]) -> Filter:
+    batch = Filter(key, '_in', ids)
+    return batch if where is None else where & batch
+
+
+def _references(records: list[dict[str, Any]], field: str) -> list[Hashable]:
+    """Foreign keys in `field`, skipping empty and already expanded references"""
+    return list(dict.fromkeys(r[field] for r in records if r.get(field) is not None and not isinstance(r[field], dict)))
+
+
+def _replace(records: list[dict[str, Any]], field: str, values: list[Any]) -> list[dict[str, Any]]:
+    resolved = dict(zip(_references(records, field), values))
+    for record in records:
+        if (id := record.get(field)) in resolved:
+            record[field] = resolved[id]
+    return records
+
+
+class Loader(Generic[_T]):
+    """Resolve many-to-one references (`activity.user`, `file.folder`, ...) in batches.
+
+    Ids are queued with `defer` and fetched together with one `Filter(key, '_in', ids)`
+    request (and-ed with any filter given) per `max_batch` ids the first time any of them is needed. Resolved records
+    are kept for the life of the loader, so use one loader per unit of work (a web
+    request, a sync run) and drop it afterwards. Ids with no record resolve to `None`.
+
+    Example:
+        ```
+        authors = Loader(directus.items.get_items, 'authors', Fields('id', 'name'))
+        articles = directus.items.get_items('articles', Limit(500))
+        authors.resolve(articles, 'author')  # one request instead of up to 500
+        ```
+    """
+
+    def __init__(self, endpoint: Callable[..., list[_T]], *args: Any, key: str = 'id', max_batch: int = 100) -> None:
+        self.endpoint = endpoint
+        self.path_args, params = _split(args)
+        self.params, self.filter = _batch_params(params, key)
+        self.key = key
+        self.max_batch = max_batch
+        self._cache: dict[Hashable, _T | None] = {}
+        self._queue: dict[Hashable, None] = {}
+
+    def prime(self, record: _T) -> None:
+        """Add an already fetched record to the cache"""
+        self._cache[record[self.key]] = record  # type: ignore[index]
+
+    def defer(self, id: Hashable) -> Callable[[], _T | None]:
+        """Queue `id` for the next batch and return a callable resolving it"""
+        if id not in self._cache:
+            self._queue[id] = None
+        return lambda: self.load(id)
+
+    def load(self, id: Hashable) -> _T | None:
+        """The record for `id`, fetching it with everything queued so far"""
+        if id not in self._cache:
+            self._queue[id] = None
+            self.dispatch()
+        return self._cache[id]
+
+    def load_many(self, ids: Iterable[Hashable]) -> list[_T | None]:
+        ids = list(ids)
+        for id in ids:
+            self.defer(id)
+        self.dispatch()
+        return [self._cache[id] for id in ids]
+
+    def resolve(self, records: list[dict[str, Any]], field: str) -> list[dict[str, Any]]:
+        """Replace the foreign key in `field` of every record with the referenced record"""
+        return _replace(records, field, self.load_many(_references(records, field)))
+
+    def dispatch(self) -> None:
+        """Fetch every queued id"""
+        queued, self._queue = list(self._queue), {}
+        for batch in chunked(queued, self.max_batch):
+            rows = self.endpoint(*self.path_args, *self.params, _batch_filter(self.filter, self.key, batch), Limit(len(batch)))
+            for row in rows:
+                self.prime(row)
+            for id in batch:
+                self._cache.setdefault(id, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._queue.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class AsyncLoader(Generic[_T]):
+    """Async counterpart of `Loader`.
+
+    Every `load` made in the same event loop tick (e.g. under one `asyncio.gather`)
+    is collected into one batch, which is fetched once the tick yields.
+    """
+
+    def __init__(self, endpoint: Callable[..., Awaitable[list[_T]]], *args: Any, key: str = 'id', max_batch: int = 100) -> None:
+        self.endpoint = endpoint
+        self.path_args, params = _split(args)
+        self.params, self.filter = _batch_params(params, key)
+        self.key = key
+        self.max_batch = max_batch
+        self._cache: dict[Hashable, asyncio.Future[_T | None]] = {}
+        self._queue: dict[Hashable, asyncio.Future[_T | None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def prime(self, record: _T) -> None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(record)
+        self._cache[record[self.key]] = future  # type: ignore[index]
+
+    async def load(self, id: Hashable) -> _T | None:
+        if (future := self._cache.get(id)) is None:
+            loop = asyncio.get_running_loop()
+            future = self._cache[id] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue[id] = future
+        return await asyncio.shield(future)
+
+    async def load_many(self, ids: Iterable[Hashable]) -> list[_T | None]:
+        return list(await asyncio.gather(*(self.load(id) for id in ids)))
+
+    async def resolve(self, records: list[dict[str, Any]], field: str) -> list[dict[str, Any]]:
+        return _replace(records, field, await self.load_many(_references(records, field)))
+
+    def _dispatch(self) -> None:
+        queued, self._queue = self._queue, {}
+        for batch in chunked(queued.items(), self.max_batch):
+            task = asyncio.ensure_future(self._fetch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: list[tuple[Hashable, asyncio.Future[_T | None]]]) -> None:
+        ids = [id for id, _ in batch]
+        try:
+            rows = await self.endpoint(*self.path_args, *self.params, _batch_filter(self.filter, self.key, ids), Limit(len(ids)))
+        except BaseException as e:
+            # Forget the failed ids so a later load retries them
+            for id, future in batch:
+                if self._cache.get(id) is future:
+                    del self._cache[id]
+                if not future.done():
+                    future.cancel() if isinstance(e, asyncio.CancelledError) else future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        found = {row[self.key]: row for row in rows}  # type: ignore[index]
+        for id, future in batch:
+            if not future.done():
+                future.set_result(found.get(id))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
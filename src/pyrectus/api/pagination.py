@@ -0,0 +1,221 @@
+from __future__ import annotations
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+from .params import DirectusParameter, Fields, Filter, FilterGroup, Limit, Offset, Page, Sort, _flatten
+
+__all__ = ['paginate', 'apaginate', 'OffsetPages', 'KeysetPages']
+
+_T = TypeVar('_T')
+
+Strategy = Literal['offset', 'keyset']
+
+
+class _Pages(ABC):
+    """Shared page bookkeeping. A `Limit` in the caller's params caps the total
+    number of items yielded (`-1` for no cap) and `Page` is dropped. `Query` params
+    are expanded into their members, so they are paged like loose params"""
+
+    def __init__(self, params: tuple[DirectusParameter, ...], page_size: int) -> None:
+        self.page_size = page_size
+        self.remaining: int | None = None
+        self.params: list[DirectusParameter] = []
+        for param in _flatten(params):
+            if isinstance(param, Limit):
+                self.remaining = None if param.limit < 0 else param.limit
+            elif not isinstance(param, Page):
+                self.params.append(param)
+
+    def _size(self) -> int:
+        self.requested = self.page_size if self.remaining is None else min(self.page_size, self.remaining)
+        return self.requested
+
+    def _consume(self, page: list[Any]) -> bool:
+        """Account for a received page, `False` when it was the last one"""
+        if len(page) < self.requested:
+            return False
+        if self.remaining is not None:
+            self.remaining -= len(page)
+        return True
+
+    @abstractmethod
+    def first(self) -> tuple[DirectusParameter, ...] | None:
+        """Params for the first page, `None` if there is nothing to fetch"""
+
+    @abstractmethod
+    def next(self, page: list[Any]) -> tuple[DirectusParameter, ...] | None:
+        """Params for the page after `page`, `None` once the walk is done"""
+
+
+class OffsetPages(_Pages):
+    """Walk a list endpoint with `Limit`/`Offset`, starting at the caller's `Offset`"""
+
+    def __init__(self, params: tuple[DirectusParameter, ...], page_size: int) -> None:
+        super().__init__(params, page_size)
+        self.offset = 0
+        for param in [p for p in self.params if isinstance(p, Offset)]:
+            self.offset = param.offset
+            self.params.remove(param)
+
+    def _request(self) -> tuple[DirectusParameter, ...] | None:
+        if (size := self._size()) <= 0:
+            return None
+        return (*self.params, Limit(size), Offset(self.offset))
+
+    def first(self) -> tuple[DirectusParameter, ...] | None:
+        return self._request()
+
+    def next(self, page: list[Any]) -> tuple[DirectusParameter, ...] | None:
+        if not self._consume(page):
+            return None
+        self.offset += len(page)
+        return self._request()
+
+
+class KeysetPages(_Pages):
+    """Walk a list endpoint by primary key instead of offset.
+
+    Each page is requested with `Filter(key, '_gt', last_key)` and `Sort(key)`, so
+    the database seeks straight to the next page instead of scanning and discarding
+    `offset` rows. The caller's filters are kept under an `_and`. `Offset` and a
+    `Sort` on any other field cannot be combined with a key walk.
+    """
+
+    def __init__(self, params: tuple[DirectusParameter, ...], page_size: int, key: str = 'id') -> None:
+        super().__init__(params, page_size)
+        self.key = key
+        self.filters: list[Filter] = []
+        for param in list(self.params):
+            if isinstance(param, Offset):
+                raise ValueError('Offset cannot be used with keyset pagination')
+            if isinstance(param, Sort):
+                if param.fields != (key,):
+                    raise ValueError(f'keyset pagination is always sorted by {key!r}')
+                self.params.remove(param)
+            elif isinstance(param, Filter):
+                self.filters.append(param)
+                self.params.remove(param)
+            elif isinstance(param, Fields) and not param.covers(key):
+                self.params[self.params.index(param)] = param + Fields(key)
+
+    def _request(self, after: Any = None) -> tuple[DirectusParameter, ...] | None:
+        if (size := self._size()) <= 0:
+            return None
+        filters = [*self.filters, Filter(self.key, '_gt', after)] if after is not None else self.filters
+        if len(filters) > 1:
+            filters = [FilterGroup('_and', *filters)]
+        return (*self.params, *filters, Sort(self.key), Limit(size))
+
+    def first(self) -> tuple[DirectusParameter, ...] | None:
+        return self._request()
+
+    def next(self, page: list[Any]) -> tuple[DirectusParameter, ...] | None:
+        if not self._consume(page):
+            return None
+        try:
+            after = page[-1][self.key]
+        except KeyError:
+            raise KeyError(f'keyset pagination needs {self.key!r} in the returned fields') from None
+        return self._request(after)
+
+
+def _strategy(strategy: Strategy, params: tuple[DirectusParameter, ...], page_size: int, key: str) -> _Pages:
+    if strategy == 'offset':
+        return OffsetPages(params, page_size)
+    if strategy == 'keyset':
+        return KeysetPages(params, page_size, key)
+    raise ValueError(f'Unknown pagination strategy {strategy!r}')
+
+
+def _split(args: tuple[Any, ...]) -> tuple[tuple[Any, ...], tuple[DirectusParameter, ...]]:
+    """Separate path arguments (e.g. a collection name) from query parameters"""
+    return (
+        tuple(a for a in args if not isinstance(a, DirectusParameter)),
+        tuple(a for a in args if isinstance(a, DirectusParameter)),
+    )
+
+
+def paginate(
+    endpoint: Callable[..., list[_T]],
+    *args: Any,
+    page_size: int = 100,
+    prefetch: bool = True,
+    strategy: Strategy = 'offset',
+    key: str = 'id',
+) -> Iterator[_T]:
+    """Lazily yield every item of a list endpoint, one page at a time.
+
+    With `prefetch` the next page is requested on a background thread while the
+    caller consumes the current one, so at most two pages are held in memory.
+    
+    `strategy='keyset'` walks by `key` (see `KeysetPages`) and stays linear on the
+    database for full-collection walks, where offset pages degrade as the offset grows.
+
+    Example:
+        ```
+        for activity in paginate(directus.activity.get_activities, Filter(...), page_size=500):
+            ...
+        ```
+    """
+    path_args, params = _split(args)
+    pages = _strategy(strategy, params, page_size, key)
+    request = pages.first()
+    if request is None:
+        return
+
+    if not prefetch:
+        while request is not None:
+            page = endpoint(*path_args, *request)
+            request = pages.next(page)
+            yield from page
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyrectus-prefetch')
+    try:
+        pending: Future[list[_T]] | None = executor.submit(endpoint, *path_args, *request)
+        while pending is not None:
+            page = pending.result()
+            request = pages.next(page)
+            pending = executor.submit(endpoint, *path_args, *request) if request is not None else None
+            yield from page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    endpoint: Callable[..., Awaitable[list[_T]]],
+    *args: Any,
+    page_size: int = 100,
+    prefetch: bool = True,
+    strategy: Strategy = 'offset',
+    key: str = 'id',
+) -> AsyncIterator[_T]:
+    """Async counterpart of `paginate`, prefetching the next page as a task"""
+    path_args, params = _split(args)
+    pages = _strategy(strategy, params, page_size, key)
+    request = pages.first()
+    if request is None:
+        return
+
+    if not prefetch:
+        while request is not None:
+            page = await endpoint(*path_args, *request)
+            request = pages.next(page)
+            for item in page:
+                yield item
+        return
+
+    pending: asyncio.Task[list[_T]] | None = asyncio.ensure_future(endpoint(*path_args, *request))
+    try:
+        while pending is not None:
+            page = await pending
+            request = pages.next(page)
+            pending = asyncio.ensure_future(endpoint(*path_args, *request)) if request is not None else None
+            for item in page:
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
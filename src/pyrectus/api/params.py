@@ -1,10 +1,20 @@
 from __future__ import annotations
+import copy
+import hashlib
+import json
+import re
 from abc import ABC
-from typing import Literal, TypedDict
+from collections.abc import Iterable, Mapping
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
+from urllib.parse import quote
 
 from httpx import QueryParams
 
-__all__ = ['Fields', 'Filter', 'Search', 'Sort', 'Limit', 'Offset', ]
+if TYPE_CHECKING:
+    from .schema import DirectusStorageAsset
+
+__all__ = ['Query', 'Var', 'CurrentUser', 'CurrentRole', 'Now', 'Follow', 'Fields', 'Filter', 'FilterGroup', 'Search', 'Sort', 'Limit', 'Offset', 'Page', 'Export', 'Transform', ]
 
 FilterOp = Literal[
     '_eq',
@@ -47,50 +57,424 @@ LogicOp = Literal['_and', '_or']
 FieldFunctions = Literal['year', 'month', 'week', 'day', 'weekday', 'hour', 'minute', 'second', 'count']
 AggregationFunc = Literal['count', 'countDistinct', 'sum', 'sumDistinct', 'avg', 'avgDistinct', 'min', 'max']
 
+Pair = tuple[str, str]
+"""`(key, 'key=value')` with the value already url encoded"""
+
+def _encode(key: str, value: str) -> Pair:
+    return key, f'{quote(key, safe="[]")}={quote(value, safe=",*")}'
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON for query values. `Var` placeholders are written as their token"""
+    return json.dumps(obj, separators=(',', ':'), default=_json_default)
+
 class DirectusParameter(ABC):
+    """Base for query parameters.
+    
+    Parameters are treated as immutable once built: the encoded form is computed on
+    first use and reused, so a parameter shared across requests is serialized once.
+    """
     def __call__(self) -> dict[str, str]: ...
+    
+    def pairs(self) -> tuple[Pair, ...]:
+        """Url encoded `(key, 'key=value')` pairs, computed once"""
+        try:
+            return self._pairs
+        except AttributeError:
+            self._pairs = tuple(_encode(k, v) for k, v in (self() or {}).items())
+            return self._pairs
 
-class CurrentUser: ...
+class Var:
+    """Placeholder for a value supplied per request to a compiled `Query`
+    
+    Example:
+        ```
+        by_id = Query(Fields('id', 'title'), Filter('id', '_eq', Var('id')))
+        items.get_items('articles', by_id.bind(id=42))
+        ```
+    """
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str) -> None:
+        if not name.isidentifier():
+            raise ValueError(f'Var name must be an identifier, got {name!r}')
+        self.name = name
+    
+    def __str__(self) -> str:
+        return f'__pyrectus_var_{self.name}__'
+    
+    def __repr__(self) -> str:
+        return f'Var({self.name!r})'
 
-class CurrentRole: ...
+def _json_default(obj: Any) -> str:
+    if isinstance(obj, (Var, _DynamicVariable)):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
 
-class Now: ...
+# A JSON encoded Var is wrapped in quotes (%22), a plain one is not
+_VAR_PATTERN = re.compile(r'%22__pyrectus_var_(\w+)__%22|__pyrectus_var_(\w+)__')
+_VAR_TOKEN = re.compile(r'__pyrectus_var_(\w+)__')
 
-class Fields: ...
+Segment = str | tuple[str, bool]
+"""Literal encoded text or a `(var name, is JSON)` slot"""
 
-class Follow: ...
+def _segments(pair: str) -> list[Segment] | None:
+    """Split an encoded pair around its `Var` tokens, `None` if it has none"""
+    segments: list[Segment] = []
+    last = 0
+    for match in _VAR_PATTERN.finditer(pair):
+        segments += [pair[last:match.start()], (match[1] or match[2], match[1] is not None)]
+        last = match.end()
+    if not segments:
+        return None
+    segments.append(pair[last:])
+    return segments
 
-class Filter(DirectusParameter):
-    def __init__(self, field: str, op: FilterOp):
+class Query(DirectusParameter):
+    """A set of parameters compiled once into an immutable, hashable query template.
+    
+    Every parameter is encoded up front. Values that change per request are
+    `Var` placeholders, filled by `bind` with a string substitution, so a hot loop
+    only encodes the values that actually change.
+    
+    Example:
+        ```
+        by_id = Query(Fields('id', 'title'), Sort('id'), Filter('id', '_eq', Var('id')))
+        for key in keys:
+            items.get_items('articles', by_id.bind(id=key))
+        ```
+    """
+    __slots__ = ('params', 'template', 'names', '_pairs', '_template')
+    
+    def __init__(self, *params: DirectusParameter) -> None:
+        self.params = tuple(_flatten(params))
+        merged = _merge(self.params)
+        self.template = '&'.join(merged.values())
+        self._template = tuple((key, pair, _segments(pair)) for key, pair in merged.items())
+        self.names = frozenset(seg[0] for *_, segments in self._template for seg in segments or () if isinstance(seg, tuple))
+        self._pairs = tuple(merged.items())
+    
+    def __call__(self) -> dict[str, str]:
+        raise TypeError('Query is pre-encoded, use pairs()')
+    
+    def pairs(self) -> tuple[Pair, ...]:
+        if self.names:
+            raise TypeError(f'Query has unbound variables {sorted(self.names)}, use bind()')
+        return self._pairs
+    
+    def bind(self, **values: Any) -> BoundQuery:
+        """Substitute `Var` values into the template"""
+        if missing := self.names - values.keys():
+            raise TypeError(f'Missing values for {sorted(missing)}')
+        return BoundQuery(self.params, tuple(
+            (key, pair) if segments is None else (key, ''.join(
+                seg if isinstance(seg, str) else quote(_dumps(values[seg[0]]) if seg[1] else str(values[seg[0]]), safe=',*')
+                for seg in segments
+            ))
+            for key, pair, segments in self._template
+        ), values)
+    
+    def __hash__(self) -> int:
+        return hash(self.template)
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Query) and other.template == self.template
+    
+    def __repr__(self) -> str:
+        return f'Query({self.template!r})'
+
+class BoundQuery(DirectusParameter):
+    """A `Query` with all of its `Var`s filled in"""
+    __slots__ = ('template', 'values', '_params', '_pairs')
+    
+    def __init__(self, template: tuple[DirectusParameter, ...], pairs: tuple[Pair, ...], values: Mapping[str, Any]) -> None:
+        self.template = template
+        self.values = values
+        self._pairs = pairs
+    
+    @property
+    def params(self) -> tuple[DirectusParameter, ...]:
+        """The member parameters with the `Var`s replaced by their values. Built on
+        first use, since sending the query only needs the pre-encoded pairs"""
+        try:
+            return self._params
+        except AttributeError:
+            self._params = tuple(_substitute(param, self.values) for param in self.template)
+            return self._params
+    
+    def __call__(self) -> dict[str, str]:
+        raise TypeError('BoundQuery is pre-encoded, use pairs()')
+
+def _substitute(obj: Any, values: Mapping[str, Any]) -> Any:
+    """Copy of `obj` with every `Var` (or `Var` token in a string) replaced by its value"""
+    if isinstance(obj, Var):
+        return values[obj.name]
+    if isinstance(obj, str):
+        return _VAR_TOKEN.sub(lambda match: str(values[match[1]]), obj) if '__pyrectus_var_' in obj else obj
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_substitute(item, values) for item in obj)
+    if isinstance(obj, dict):
+        return {key: _substitute(value, values) for key, value in obj.items()}
+    if isinstance(obj, DirectusParameter):
+        clone = copy.copy(obj)
+        # Drop the cached encodings, they still hold the Var tokens
+        clone.__dict__ = {
+            name: _substitute(value, values)
+            for name, value in vars(obj).items() if name not in ('_pairs', 'json')
+        }
+        return clone
+    return obj
+
+def _flatten(params: Iterable[DirectusParameter], bound: bool = True) -> Iterable[DirectusParameter]:
+    """Expand nested `Query`/`BoundQuery` into their member parameters. With
+    `bound=False` a `BoundQuery` yields its unbound members, enough when only
+    their types are checked"""
+    for param in params:
+        if isinstance(param, BoundQuery) and not bound:
+            yield from param.template
+        elif isinstance(param, (Query, BoundQuery)):
+            yield from param.params
+        else:
+            yield param
+
+_AND_OPEN, _AND_CLOSE = quote('{"_and":['), quote(']}')
+
+def _merge(params: Iterable[DirectusParameter]) -> dict[str, str]:
+    """Encoded pairs by key. Several filters are combined under one `_and` and
+    several aggregates with the same function list all of their fields. Any other
+    parameter given twice is overridden by the later one
+    
+    Directus reads a single `filter`, so `Filter(a), Filter(b)` means `a & b`.
+    """
+    merged: dict[str, str] = {}
+    filters: list[str] = []
+    for param in params:
+        for key, pair in param.pairs():
+            if key == 'filter':
+                filters.append(pair.partition('=')[2])
+                merged.setdefault(key, pair)
+            elif key.startswith('aggregate[') and key in merged:
+                merged[key] += ',' + pair.partition('=')[2]
+            else:
+                merged[key] = pair
+    if len(filters) > 1:
+        merged['filter'] = f'filter={_AND_OPEN}{",".join(filters)}{_AND_CLOSE}'
+    return merged
+
+class _DynamicVariable:
+    """Filter value resolved by Directus when the query runs"""
+    token: str
+    
+    def __str__(self) -> str:
+        return self.token
+    
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.token!r})'
+
+class CurrentUser(_DynamicVariable):
+    """`$CURRENT_USER`, or a field of the current user (`$CURRENT_USER.role.name`)"""
+    def __init__(self, field: str | None = None) -> None:
+        self.token = f'$CURRENT_USER.{field}' if field else '$CURRENT_USER'
+
+class CurrentRole(_DynamicVariable):
+    """`$CURRENT_ROLE`, or a field of the current role (`$CURRENT_ROLE.name`)"""
+    def __init__(self, field: str | None = None) -> None:
+        self.token = f'$CURRENT_ROLE.{field}' if field else '$CURRENT_ROLE'
+
+class Now(_DynamicVariable):
+    """`$NOW`, optionally adjusted (`Now('-1 year')` -> `$NOW(-1 year)`)"""
+    def __init__(self, adjustment: str | None = None) -> None:
+        self.token = f'$NOW({adjustment})' if adjustment else '$NOW'
+
+class Fields(DirectusParameter):
+    """Projection of the fields returned, as short as possible
+    
+    Paths may be dotted (`author.avatar.id`), relational projections can be given as
+    keyword `Fields`, and `of` derives the list from a schema `TypedDict` so only the
+    columns that are read are sent back.
+    
+    Example:
+        ```
+        Fields('id', 'title', author=Fields('first_name', 'email'))
+        # fields=id,title,author.first_name,author.email
+        Fields.of(DirectusFile, exclude=('metadata',), folder=Fields('name'))
+        ```
+    """
+    def __init__(self, *paths: str, **relations: Fields) -> None:
+        expanded = [*paths]
+        for relation, nested in relations.items():
+            expanded.extend(f'{relation}.{path}' for path in nested.paths)
+        self.paths = tuple(dict.fromkeys(expanded))
+    
+    @classmethod
+    def of(cls, schema: type, *, exclude: Iterable[str] = (), **relations: Fields) -> Fields:
+        """Every field declared on a `TypedDict`, with relational fields replaced by
+        their keyword projection"""
+        skip = set(exclude) | relations.keys()
+        return cls(*(name for name in schema.__annotations__ if name not in skip), **relations)
+    
+    @classmethod
+    def wildcard(cls, depth: int = 1) -> Fields:
+        """`*` for depth 1, `*.*` for depth 2, ... Each level expands one more level of relations"""
+        if depth < 1:
+            raise ValueError('depth must be at least 1')
+        return cls('.'.join('*' * depth))
+    
+    def covers(self, field: str) -> bool:
+        """Whether `field` on the root collection is returned by this projection"""
+        return field in self.paths or any(path.split('.')[0] == '*' for path in self.paths)
+    
+    def __add__(self, other: Fields) -> Fields:
+        return Fields(*self.paths, *other.paths)
+    
+    def __call__(self) -> dict[str, str]:
+        return {'fields': ','.join(self.paths)}
+    
+    def __repr__(self) -> str:
+        return f'Fields({", ".join(map(repr, self.paths))})'
+
+class Follow:
+    """Follow a relation backwards from a collection without an alias field
+    
+    Example:
+        ```
+        Filter(f'{Follow("articles", "author")}.title', '_icontains', 'directus')
+        ```
+    """
+    def __init__(self, collection: str, field: str) -> None:
+        self.collection = collection
         self.field = field
+    
+    def __str__(self) -> str:
+        return f'$FOLLOW({self.collection},{self.field})'
+
+class Filter(DirectusParameter):
+    """A single filter rule, composable with `&` and `|`
+    
+    Dotted fields filter through relations, and a `Filter` value nests a rule
+    under relational operators such as `_some`/`_none`. The JSON is built once and
+    reused by every request and every group the filter is part of.
+    
+    Example:
+        ```
+        published = Filter('status', '_eq', 'published')
+        mine = Filter('author.id', '_eq', CurrentUser())
+        tagged = Filter('tags', '_some', Filter('name', '_in', ['python', 'rust']))
+        items.get_items('articles', published & (mine | tagged))
+        ```
+    """
+    def __init__(self, field: str | Follow, op: FilterOp, value: Any = True):
+        self.field = str(field)
         self.op = op
+        self.value = value
+    
+    @cached_property
+    def json(self) -> str:
+        """Compact JSON of the rule, built once"""
+        value = self.value.json if isinstance(self.value, Filter) else _dumps(self.value)
+        rule = f'{{{_dumps(self.op)}:{value}}}'
+        for segment in reversed(self.field.split('.')):
+            rule = f'{{{_dumps(segment)}:{rule}}}'
+        return rule
+    
+    def __call__(self) -> dict[str, str]:
+        return {'filter': self.json}
     
+    def __and__(self, other: Filter) -> FilterGroup:
+        return FilterGroup('_and', self, other)
+    
+    def __or__(self, other: Filter) -> FilterGroup:
+        return FilterGroup('_or', self, other)
+    
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.json})'
+
+class FilterGroup(Filter):
+    """Combine filters under a single `_and`/`_or`. Directus only reads one `filter` parameter
+    
+    Nested groups with the same operator are flattened, so `a & b & c` is one `_and`.
+    """
+    def __init__(self, op: LogicOp, *filters: Filter):
+        self.op = op
+        self.filters = tuple(
+            member
+            for f in filters
+            for member in (f.filters if isinstance(f, FilterGroup) and f.op == op else (f,))
+        )
+    
+    @cached_property
+    def json(self) -> str:
+        return f'{{"{self.op}":[{",".join(f.json for f in self.filters)}]}}'
 
 class Search(DirectusParameter): ...
 
-class Sort(DirectusParameter): ...
+class Sort(DirectusParameter):
+    """Sort by one or more fields, prefix a field with `-` for descending order"""
+    def __init__(self, *fields: str) -> None:
+        self.fields = fields
+    
+    def __call__(self) -> dict[str, str]:
+        return {'sort': ','.join(self.fields)}
 
-class Limit(DirectusParameter): ...
+class Limit(DirectusParameter):
+    """Maximum number of items returned. `-1` returns every item"""
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+    
+    def __call__(self) -> dict[str, str]:
+        return {'limit': str(self.limit)}
 
-class Offset(DirectusParameter): ...
+class Offset(DirectusParameter):
+    """Number of items to skip"""
+    def __init__(self, offset: int) -> None:
+        self.offset = offset
+    
+    def __call__(self) -> dict[str, str]:
+        return {'offset': str(self.offset)}
 
-class Page(DirectusParameter): ...
+class Page(DirectusParameter):
+    """1 indexed page of `Limit` items"""
+    def __init__(self, page: int) -> None:
+        self.page = page
+    
+    def __call__(self) -> dict[str, str]:
+        return {'page': str(self.page)}
     
 class Aggregate(DirectusParameter):
+    """Aggregate `fields` with `func`. Only `count` accepts `*`"""
     def __init__(self, func: AggregationFunc, *fields: Literal['*'] | str) -> None:
+        if not fields:
+            raise ValueError('Aggregate needs at least one field')
         self.func = func
         self.fields = fields
     
     def __call__(self) -> dict[str, str]:
-        return {f'agregate[{self.func}]': ','.join(self.fields)}
+        return {f'aggregate[{self.func}]': ','.join(self.fields)}
 
-class GroupBy(DirectusParameter): ...
+class GroupBy(DirectusParameter):
+    """Group aggregates by one or more fields or field functions (`year(date_created)`)"""
+    def __init__(self, *fields: str) -> None:
+        if not fields:
+            raise ValueError('GroupBy needs at least one field')
+        self.fields = fields
+    
+    def __call__(self) -> dict[str, str]:
+        return {'groupBy': ','.join(self.fields)}
 
 class Deep(DirectusParameter): ...
 
 class Alias(DirectusParameter): ...
 
-class Export(DirectusParameter): ...
+ExportFormat = Literal['csv', 'json', 'xml', 'yaml']
+
+class Export(DirectusParameter):
+    """Have the server serialize the result as a `format` file instead of a JSON response"""
+    def __init__(self, format: ExportFormat) -> None:
+        if format not in ('csv', 'json', 'xml', 'yaml'):
+            raise ValueError(f'Unknown export format {format!r}')
+        self.format = format
+    
+    def __call__(self) -> dict[str, str]:
+        return {'export': self.format}
 
 class Version(DirectusParameter): ...
 
@@ -100,6 +484,70 @@ class Backlink(DirectusParameter): ...
 
 class Meta(DirectusParameter): ...
 
+AssetFit = Literal['cover', 'contain', 'inside', 'outside']
+AssetFormat = Literal['auto', 'jpeg', 'png', 'webp', 'tiff', 'avif']
+
+class Transform(DirectusParameter):
+    """Image transformation for `/assets/{id}`, either a preset `key` or explicit options
+    
+    Parameters are emitted in a fixed order, so equal transforms always produce the
+    same query and the same `cache_key`.
+    
+    Example:
+        ```
+        thumb = Transform(width=320, height=320, fit='cover', format='webp', quality=80)
+        blurred = Transform(transforms=[['blur', 10], ['rotate', 90]])
+        ```
+    """
+    def __init__(
+        self,
+        *,
+        key: str | None = None,
+        fit: AssetFit | None = None,
+        width: int | None = None,
+        height: int | None = None,
+        quality: int | None = None,
+        format: AssetFormat | None = None,
+        without_enlargement: bool | None = None,
+        transforms: list[list[Any]] | None = None,
+    ) -> None:
+        self.values: dict[str, str] = {}
+        for name, value in (
+            ('fit', fit),
+            ('format', format),
+            ('height', height),
+            ('key', key),
+            ('quality', quality),
+            ('transforms', _dumps(transforms) if transforms else None),
+            ('width', width),
+            ('withoutEnlargement', None if without_enlargement is None else str(without_enlargement).lower()),
+        ):
+            if value is not None:
+                self.values[name] = str(value)
+    
+    @classmethod
+    def of(cls, preset: DirectusStorageAsset) -> Transform:
+        """Explicit transform equivalent to a `storage_asset_presets` entry"""
+        return cls(
+            fit=preset.get('fit'),
+            width=preset.get('width'),
+            height=preset.get('height'),
+            quality=preset.get('quality'),
+            format=preset.get('format'),
+            without_enlargement=preset.get('withoutEnlargement'),
+            transforms=preset.get('transforms') or None,
+        )
+    
+    def cache_key(self, id: str) -> str:
+        """Stable key for the derivative of asset `id` rendered with this transform"""
+        return hashlib.sha256(f'{id}?{"&".join(p for _, p in self.pairs())}'.encode()).hexdigest()
+    
+    def __call__(self) -> dict[str, str]:
+        return self.values
+    
+    def __repr__(self) -> str:
+        return f'Transform({self.values})'
+
 # Root param object that compiles all built parameters
 class Params(TypedDict, total=False):
     fields: Fields
@@ -118,11 +566,11 @@ class Params(TypedDict, total=False):
     backlink: Backlink
     
 
-def parse_params(params: Params) -> QueryParams:
-    qp = QueryParams()
-    
-    for _, v in params.items():
-        v: DirectusParameter
-        qp.update(v())
-    
-    return qp
\ No newline at end of file
+def compile_params(params: Params | Iterable[DirectusParameter]) -> str:
+    """Join the pre-encoded parameters into a query string (without the leading `?`)"""
+    if isinstance(params, Mapping):
+        params = params.values()
+    return '&'.join(_merge(params).values())
+
+def parse_params(params: Params | Iterable[DirectusParameter]) -> QueryParams:
+    return QueryParams(compile_params(params))
\ No newline at end of file
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from collections.abc import Iterator, Mapping
+from functools import cache
+from typing import Any, overload
+
+__all__ = ['Record', 'record_class', 'compact']
+
+
+class Record(Mapping[str, Any]):
+    """Compact stand-in for a schema TypedDict record.
+
+    Subclasses made by `record_class` keep every declared key in a `__slots__`
+    attribute instead of a per-record hash table, which makes a record of the
+    larger schemas several times smaller than the equivalent dict. Keys the
+    TypedDict does not declare go to a small overflow dict, created only when
+    needed. Reads work as on the dict (`record['id']`, `.get`, `in`, `dict(record)`)
+    and as attributes (`record.id`). Missing keys raise `KeyError`, like on the
+    TypedDict.
+    """
+    __slots__ = ('_extra',)
+    _fields: frozenset[str] = frozenset()
+    __schema__: type
+
+    def __init__(self, data: Mapping[str, Any] | None = None, /, **values: Any) -> None:
+        self._extra: dict[str, Any] | None = None
+        for key, value in (data or values).items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._fields:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._fields and hasattr(self, key):
+            delattr(self, key)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in type(self).__slots__:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """The record as the plain dict its TypedDict describes"""
+        return dict(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Generated classes are not importable by name, rebuild them from the schema
+        return _restore, (type(self).__schema__, self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+
+@cache
+def record_class(schema: type) -> type[Record]:
+    """The `Record` subclass for a schema TypedDict, generated once per schema"""
+    reserved = {name for klass in Record.__mro__ for name in vars(klass)}
+    slots = tuple(name for name in schema.__annotations__ if name.isidentifier() and name not in reserved)
+    return type(schema.__name__, (Record,), {
+        '__slots__': slots,
+        '__module__': __name__,
+        '__doc__': f'Compact `{schema.__name__}` record',
+        '__annotations__': dict(schema.__annotations__),
+        '_fields': frozenset(slots),
+        '__schema__': schema,
+    })
+
+
+def _restore(schema: type, data: dict[str, Any]) -> Record:
+    return record_class(schema)(data)
+
+
+@overload
+def compact(data: list[dict[str, Any]], schema: type) -> list[Record]: ...
+@overload
+def compact(data: dict[str, Any], schema: type) -> Record: ...
+def compact(data: Any, schema: type) -> Any:
+    """Convert a record, or a list of records, of `schema` into compact records.
+    Anything else (e.g. `None`) is returned unchanged
+
+    Example:
+        ```
+        cache = compact(directus.activity.get_activities(Limit(-1)), DirectusActivity)
+        cache[0]['action']
+        ```
+    """
+    cls = record_class(schema)
+    if isinstance(data, dict):
+        return cls(data)
+    if isinstance(data, list):
+        return [cls(row) if isinstance(row, dict) else row for row in data]
+    return data
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import asyncio
+import random
+import time
+from collections.abc import Iterable
+from email.utils import parsedate_to_datetime
+from threading import Lock
+
+from httpx import Response
+
+__all__ = ['RetryPolicy', 'RateLimiter', 'DEFAULT_RETRY']
+
+
+def _retry_after(response: Response) -> float | None:
+    """Seconds requested by a `Retry-After` header, given as seconds or an HTTP date"""
+    if (value := response.headers.get('retry-after')) is None:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """When and how long to wait before resending a failed request.
+
+    Responses with a status in `statuses` and connection errors are retried up to
+    `attempts` times in total, for `methods` only. POST and PATCH are not retried
+    unless listed, since resending them may create or apply a change twice. A
+    request whose body is a stream (uploads) is never retried.
+
+    The wait is the `Retry-After` of the response when present, otherwise an
+    exponential backoff with full jitter, `uniform(0, min(max_backoff, backoff * 2**n))`.
+    A `Retry-After` longer than `max_retry_after` is not waited for.
+
+    Example:
+        ```
+        Transport(url, retry=RetryPolicy(methods=('GET', 'DELETE', 'POST', 'PATCH')))
+        ```
+    """
+
+    def __init__(
+        self,
+        attempts: int = 4,
+        *,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        statuses: Iterable[int] = (429, 502, 503, 504),
+        methods: Iterable[str] = ('GET', 'DELETE'),
+    ) -> None:
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+
+    def delay(self, method: str, attempt: int, response: Response | None = None) -> float | None:
+        """Seconds to wait before resending after failed `attempt` (0 based), `None` to give up.
+        `response` is the error response, or `None` for a connection error"""
+        if attempt + 1 >= self.attempts or method not in self.methods:
+            return None
+        if response is not None:
+            if response.status_code not in self.statuses:
+                return None
+            if (wait := _retry_after(response)) is not None:
+                return wait if wait <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+DEFAULT_RETRY = RetryPolicy()
+"""Retries GET and DELETE on 429/502/503/504 and connection errors"""
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second with bursts of up to `burst`.
+
+    One limiter can be shared by any number of transports, threads and tasks.
+    Tokens are reserved under a short lock and the wait happens outside of it,
+    so async callers never block the event loop.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        if (wait := self._reserve()) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        if (wait := self._reserve()) > 0:
+            await asyncio.sleep(wait)
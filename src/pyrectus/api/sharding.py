@@ -0,0 +1,140 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from math import ceil
+from typing import Any, TypeVar
+
+from .pagination import _split, apaginate, paginate
+from .params import Aggregate, DirectusParameter, Filter, Limit, Offset, Page, Search, Sort, _flatten
+
+__all__ = ['export_sharded', 'aexport_sharded', 'plan_shards', 'SHARD_PAGES']
+
+_T = TypeVar('_T')
+
+Shard = tuple[DirectusParameter, ...]
+
+SHARD_PAGES = 4
+"""Pages per shard when the number of shards is derived from the item count"""
+
+
+def _stats_params(key: str, params: tuple[DirectusParameter, ...]) -> tuple[DirectusParameter, ...]:
+    params = tuple(_flatten(params))
+    for param in params:
+        if isinstance(param, (Limit, Offset, Page, Sort)):
+            raise ValueError(f'{type(param).__name__} is managed by the key range split of the export')
+    scope = tuple(p for p in params if isinstance(p, (Filter, Search)))
+    return (*scope, Aggregate('count', '*'), Aggregate('min', key), Aggregate('max', key))
+
+
+def _aggregate_value(value: Any, key: str) -> Any:
+    """Directus returns `{"count": 10}` for `*` and `{"min": {"id": 1}}` for a field"""
+    return value.get(key) if isinstance(value, dict) else value
+
+
+def plan_shards(stats: list[dict[str, Any]], key: str, shards: int | None, page_size: int) -> tuple[list[Shard], bool]:
+    """Split a collection into shards from its `count`/`min`/`max` aggregate.
+
+    Without `shards` every shard holds about `SHARD_PAGES` pages, so the number of
+    shards grows with the collection while the size of each one stays bounded.
+    Integer keys are split into equal key ranges walked by keyset pagination. Any
+    other key (e.g. uuid) falls back to contiguous `Offset`/`Limit` windows sorted
+    by key. Returns the per-shard params and whether the shards are keyset walks.
+    """
+    row = stats[0] if stats else {}
+    count = int(row.get('count') or 0)
+    if count == 0:
+        return [], True
+    if shards is None:
+        shards = ceil(count / (SHARD_PAGES * page_size))
+    shards = max(1, min(shards, ceil(count / page_size)))
+    try:
+        low = int(_aggregate_value(row['min'], key))
+        high = int(_aggregate_value(row['max'], key))
+    except (KeyError, TypeError, ValueError):
+        size = ceil(count / shards)
+        return [(Sort(key), Offset(i * size), Limit(size)) for i in range(shards)], False
+
+    width = ceil((high - low + 1) / shards)
+    return [
+        (Filter(key, '_gte', start), Filter(key, '_lt', start + width))
+        for start in range(low, high + 1, width)
+    ], True
+
+
+def export_sharded(
+    endpoint: Callable[..., list[_T]],
+    *args: Any,
+    max_workers: int = 8,
+    shards: int | None = None,
+    page_size: int = 1000,
+    key: str = 'id',
+) -> Iterator[_T]:
+    """Export a whole collection by fetching key-range shards concurrently.
+
+    The item count and key range are read first with one `Aggregate` request,
+    then the shards (by default about `SHARD_PAGES` pages each, see `plan_shards`)
+    are walked on a thread pool. Items are yielded in key order and at most
+    `max_workers` shards are held at once, so memory stays near
+    `max_workers * SHARD_PAGES * page_size` items whatever the collection size.
+
+    Example:
+        ```
+        for item in export_sharded(directus.items.get_items, 'articles', Filter(...), max_workers=16):
+            ...
+        ```
+    """
+    path_args, params = _split(args)
+    stats = endpoint(*path_args, *_stats_params(key, params))
+    plan, keyset = plan_shards(stats, key, shards, page_size)
+    strategy = 'keyset' if keyset else 'offset'
+
+    def fetch(shard: Shard) -> list[_T]:
+        return list(paginate(endpoint, *path_args, *params, *shard, page_size=page_size, prefetch=False, strategy=strategy, key=key))
+
+    queued = iter(plan)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pyrectus-shard')
+    try:
+        window: deque[Future[list[_T]]] = deque(executor.submit(fetch, shard) for _, shard in zip(range(max_workers), queued))
+        while window:
+            items = window.popleft().result()
+            if (shard := next(queued, None)) is not None:
+                window.append(executor.submit(fetch, shard))
+            yield from items
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aexport_sharded(
+    endpoint: Callable[..., Awaitable[list[_T]]],
+    *args: Any,
+    max_workers: int = 8,
+    shards: int | None = None,
+    page_size: int = 1000,
+    key: str = 'id',
+) -> AsyncIterator[_T]:
+    """Async counterpart of `export_sharded`, with `max_workers` concurrent shard tasks"""
+    path_args, params = _split(args)
+    stats = await endpoint(*path_args, *_stats_params(key, params))
+    plan, keyset = plan_shards(stats, key, shards, page_size)
+    strategy = 'keyset' if keyset else 'offset'
+
+    async def fetch(shard: Shard) -> list[_T]:
+        return [
+            item async for item in
+            apaginate(endpoint, *path_args, *params, *shard, page_size=page_size, prefetch=False, strategy=strategy, key=key)
+        ]
+
+    queued = iter(plan)
+    window: deque[asyncio.Task[list[_T]]] = deque(asyncio.ensure_future(fetch(shard)) for _, shard in zip(range(max_workers), queued))
+    try:
+        while window:
+            items = await window.popleft()
+            if (shard := next(queued, None)) is not None:
+                window.append(asyncio.ensure_future(fetch(shard)))
+            for item in items:
+                yield item
+    finally:
+        for pending in window:
+            pending.cancel()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .schema import DirectusDiff, DirectusSchema
+
+__all__ = ['SnapshotCache', 'SnapshotCheck', 'snapshot_hash', 'SNAPSHOT_MAX_AGE']
+
+SNAPSHOT_MAX_AGE = 300.0
+"""Seconds a confirmed snapshot is used without any request, e.g. by pods starting together"""
+
+
+def snapshot_hash(snapshot: DirectusSchema) -> str:
+    """Content hash of a snapshot, independent of key order"""
+    return hashlib.sha256(json.dumps(snapshot, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+def _default_directory() -> Path:
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'pyrectus' / 'schema'
+
+
+class SnapshotCache:
+    """On-disk store of the last `/schema/snapshot` of one Directus instance.
+
+    Snapshots are written to `<directory>/<instance>/<hash>.json` and the `current`
+    file names the active hash. Its mtime records when the snapshot was last
+    confirmed against the server. Writes are atomic, so concurrent workers sharing
+    a directory only ever read a complete snapshot.
+    """
+
+    def __init__(self, url: str, directory: str | Path | None = None) -> None:
+        instance = re.sub(r'[^\w.-]+', '_', url.split('://', 1)[-1]).strip('_')
+        self.directory = Path(directory or _default_directory()) / instance
+        self.pointer = self.directory / 'current'
+
+    def load(self) -> tuple[str, DirectusSchema, float] | None:
+        """`(hash, snapshot, last confirmed)` or `None` if nothing usable is cached"""
+        try:
+            digest = self.pointer.read_text().strip()
+            checked = self.pointer.stat().st_mtime
+            snapshot = json.loads((self.directory / f'{digest}.json').read_bytes())
+        except (OSError, ValueError):
+            return None
+        return digest, snapshot, checked
+
+    def save(self, snapshot: DirectusSchema) -> str:
+        """Store a snapshot under its hash, make it current and drop older snapshots"""
+        digest = snapshot_hash(snapshot)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._write(self.directory / f'{digest}.json', json.dumps(snapshot, separators=(',', ':')))
+        self._write(self.pointer, digest)
+        for stale in self.directory.glob('*.json'):
+            if stale.stem != digest:
+                stale.unlink(missing_ok=True)
+        return digest
+
+    def touch(self) -> None:
+        """Record that the current snapshot was just confirmed unchanged"""
+        self.pointer.touch()
+
+    def _write(self, path: Path, data: str) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+class SnapshotCheck:
+    """The decisions of `Schema.cached_snapshot`, shared by the sync and async
+    endpoints which only send the requests.
+
+    A snapshot confirmed less than `max_age` seconds ago is `trusted` as is. An
+    older one is `stale` and checked with `/schema/diff`: an empty diff confirms
+    it, anything else (a difference or a rejected diff) means a full refetch.
+    """
+
+    def __init__(self, cache: SnapshotCache, max_age: float) -> None:
+        self.cache = cache
+        cached = cache.load()
+        self.snapshot = cached[1] if cached is not None else None
+        self.trusted = cached is not None and time() - cached[2] < max_age
+
+    @property
+    def stale(self) -> bool:
+        return self.snapshot is not None and not self.trusted
+
+    def diffed(self, diff: DirectusDiff | None) -> None:
+        if diff is None:
+            self.cache.touch()
+            self.trusted = True
+
+    def result(self) -> DirectusSchema | None:
+        """The cached snapshot if it can be used, `None` when it must be refetched"""
+        return self.snapshot if self.trusted else None
+
+    def fetched(self, snapshot: DirectusSchema) -> DirectusSchema:
+        self.cache.save(snapshot)
+        return snapshot
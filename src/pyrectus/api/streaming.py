@@ -0,0 +1,164 @@
+from __future__ import annotations
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any, Literal
+
+from .transport import AsyncTransport, Transport
+
+__all__ = ['DataParser', 'iter_data', 'aiter_data', 'stream_data', 'astream_data', 'DEFAULT_STREAM_CHUNK']
+
+DEFAULT_STREAM_CHUNK = 1 << 16
+"""Bytes read from the response per chunk while parsing a streamed list"""
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z')
+
+_State = Literal['start', 'key', 'items', 'done']
+
+
+class DataParser:
+    """Push parser for a Directus list response that yields the elements of its
+    top-level `data` array as soon as each one is complete.
+
+    Only the element being parsed is held in memory, so a response of any size is
+    processed in the memory of its largest record. Other members (`meta`) are
+    parsed and dropped. An element split across chunks is retried once the buffer
+    has grown by its pending size, which keeps the total parsing work linear.
+
+    Example:
+        ```
+        parser = DataParser()
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+        parser.close()
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ''
+        self._pos = 0
+        self._retry_at = 0
+        self._state: _State = 'start'
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add bytes of the body, returning the elements they completed"""
+        self._buffer += self._text.decode(chunk)
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """Signal the end of the body, raising `ValueError` if the document is incomplete"""
+        self._buffer += self._text.decode(b'', final=True)
+        items = self._parse(final=True)
+        if self._state != 'done':
+            raise ValueError('Response ended before the JSON document was complete')
+        return items
+
+    def _value(self, pos: int, final: bool) -> tuple[Any, int] | None:
+        """Decode the value at `pos`, `None` if it may continue past the buffer"""
+        buffer = self._buffer
+        try:
+            value, end = self._raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        # A number (or literal) ending at the buffer edge may still be cut short,
+        # also when only part of its fraction or exponent arrived (`1.`, `1e+`)
+        if not final and _NUMBER_TAIL.match(buffer, end):
+            return None
+        return value, end
+
+    def _skip(self, pos: int) -> int:
+        return _WHITESPACE.match(self._buffer, pos).end()  # type: ignore[union-attr]
+
+    def _parse(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer = self._buffer
+        while (pos := self._skip(self._pos)) < len(buffer):
+            char = buffer[pos]
+            if self._state == 'start':
+                if char != '{':
+                    raise ValueError(f'Expected a JSON object, got {char!r}')
+                self._pos, self._state = pos + 1, 'key'
+            elif self._state == 'done':
+                raise ValueError('Unexpected data after the JSON document')
+            elif char == ',':
+                self._pos = pos + 1
+            elif self._state == 'items':
+                if char == ']':
+                    self._pos, self._state = pos + 1, 'key'
+                    continue
+                if (decoded := self._value(pos, final)) is None:
+                    break
+                item, self._pos = decoded
+                items.append(item)
+            elif char == '}':
+                self._pos, self._state = pos + 1, 'done'
+            else:
+                if (decoded := self._value(pos, final)) is None:
+                    break
+                key, end = decoded
+                if (colon := self._skip(end)) >= len(buffer) or (value := self._skip(colon + 1)) >= len(buffer):
+                    break
+                if buffer[colon] != ':':
+                    raise ValueError(f'Expected ":" after {key!r}')
+                if key == 'data':
+                    if buffer[value] != '[':
+                        raise ValueError('`data` is not an array')
+                    self._pos, self._state = value + 1, 'items'
+                    continue
+                if (decoded := self._value(value, final)) is None:
+                    break
+                self._pos = decoded[1]
+        else:
+            self._retry_at = 0
+            self._compact()
+            return items
+        # Incomplete value, wait for the pending text to double before trying again
+        self._retry_at = 2 * len(buffer) - self._pos
+        self._compact()
+        return items
+
+    def _compact(self) -> None:
+        if self._pos > DEFAULT_STREAM_CHUNK:
+            self._buffer = self._buffer[self._pos:]
+            self._retry_at = max(0, self._retry_at - self._pos)
+            self._pos = 0
+
+
+def iter_data(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the `data` elements of a list response body given as byte chunks"""
+    parser = DataParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_data(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Async counterpart of `iter_data`"""
+    parser = DataParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+def stream_data(transport: Transport, url: str, chunk_size: int = DEFAULT_STREAM_CHUNK) -> Iterator[Any]:
+    """GET a list endpoint and yield its records while the body is still arriving"""
+    with transport.stream('GET', url) as response:
+        yield from iter_data(response.iter_bytes(chunk_size))
+
+
+async def astream_data(transport: AsyncTransport, url: str, chunk_size: int = DEFAULT_STREAM_CHUNK) -> AsyncIterator[Any]:
+    """Async counterpart of `stream_data`"""
+    async with transport.stream('GET', url) as response:
+        async for item in aiter_data(response.aiter_bytes(chunk_size)):
+            yield item
@@ -0,0 +1,367 @@
+from __future__ import annotations
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from typing import Any, ClassVar, Literal
+
+from httpx import AsyncClient, Client, Headers, Limits, QueryParams, Response, Timeout, TransportError
+
+from .cache import ResponseCache, cache_scope
+from .coalesce import AsyncSingleFlight, SingleFlight
+from .decoding import Backend, Decoder, _msgspec, json_decoder, record_decoder, typed_decoder
+from .retry import DEFAULT_RETRY, RateLimiter, RetryPolicy
+
+__all__ = ['Transport', 'AsyncTransport', 'DirectusError', 'DEFAULT_LIMITS', 'DEFAULT_TIMEOUT']
+
+Method = Literal['GET', 'POST', 'PATCH', 'DELETE', 'SEARCH']
+
+DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+"""Pool limits used when none are given. Keep-alive connections are reused across all endpoint groups"""
+
+DEFAULT_TIMEOUT = Timeout(30.0, connect=10.0)
+
+
+class DirectusError(Exception):
+    """Raised for any 4xx/5xx response. `errors` holds the Directus `errors` array when present"""
+
+    def __init__(self, response: Response) -> None:
+        self.response = response
+        self.status_code = response.status_code
+        try:
+            self.errors: list[dict[str, Any]] = response.json().get('errors', [])
+        except (ValueError, AttributeError):
+            self.errors = []
+        message = '; '.join(e.get('message', '') for e in self.errors) or response.reason_phrase
+        super().__init__(f'{response.status_code} {response.request.method} {response.request.url.path}: {message}')
+
+
+def _headers(token: str | None, headers: dict[str, str] | None) -> dict[str, str]:
+    merged = {'Accept': 'application/json'}
+    if token:
+        merged['Authorization'] = f'Bearer {token}'
+    if headers:
+        merged.update(headers)
+    return merged
+
+
+def _unwrap(response: Response, decode: Decoder = json.loads) -> Any:
+    """Strip the Directus `{"data": ...}` envelope"""
+    if response.status_code == 204 or not response.content:
+        return None
+    if not response.headers.get('content-type', '').startswith('application/json'):
+        return response.text
+    payload = decode(response.content)
+    if isinstance(payload, dict) and 'data' in payload:
+        return payload['data']
+    return payload
+
+
+def _decoder(decode: Backend | Decoder, structs: bool) -> Decoder:
+    if structs:
+        _msgspec()
+    return json_decoder(decode) if isinstance(decode, str) else decode
+
+
+def _replayable(options: dict[str, Any]) -> bool:
+    """Whether the request body can be sent again, a streamed body is consumed by the first try"""
+    return isinstance(options.get('content'), (bytes, str, type(None)))
+
+
+def _flight_key(path: str, params: QueryParams | None) -> str:
+    return path if params is None else f'{path}?{params}'
+
+
+def _scope(client: Client | AsyncClient, headers: dict[str, str] | None) -> str:
+    """Cache scope of a request, from the credentials it is actually sent with"""
+    authorization = Headers(headers).get('authorization') if headers else None
+    return cache_scope(str(client.base_url), authorization or client.headers.get('authorization'))
+
+
+class _BaseTransport:
+    """State and retry/cache decisions shared by `Transport` and `AsyncTransport`,
+    which add the I/O on their own client"""
+
+    _client: ClassVar[type[Client] | type[AsyncClient]]
+    _flights: ClassVar[type[SingleFlight] | type[AsyncSingleFlight]]
+
+    def __init__(
+        self,
+        url: str,
+        token: str | None = None,
+        *,
+        limits: Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        timeout: Timeout | float = DEFAULT_TIMEOUT,
+        headers: dict[str, str] | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        decoder: Backend | Decoder = 'auto',
+        structs: bool = False,
+        records: bool = False,
+        retry: RetryPolicy | None = DEFAULT_RETRY,
+        rate_limit: RateLimiter | None = None,
+        **client_options: Any,
+    ) -> None:
+        self.url = url
+        self.cache = cache
+        self.flights = self._flights() if coalesce else None
+        self.decode = _decoder(decoder, structs)
+        self.structs = structs
+        self.records = records
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.client = self._client(
+            base_url=url,
+            headers=_headers(token, headers),
+            limits=limits,
+            http2=http2,
+            timeout=timeout,
+            **client_options,
+        )
+
+    def _cacheable(self, method: Method, params: QueryParams | None) -> bool:
+        """Whether the request is served through the response cache"""
+        return self.cache is not None and method == 'GET' and params is None
+
+    def _written(self, method: Method, path: str) -> None:
+        """Drop the cached responses a successful write may have changed"""
+        if self.cache is not None and method != 'GET':
+            self.cache.invalidate(path)
+
+    def _backoff(self, method: Method, attempt: int, response: Response | None, options: dict[str, Any]) -> float | None:
+        if self.retry is None or not _replayable(options):
+            return None
+        return self.retry.delay(method, attempt, response)
+
+    def _decoder(self, returns: str | None) -> Decoder:
+        if returns is not None:
+            if self.structs and (typed := typed_decoder(returns)) is not None:
+                return typed
+            if self.records and (compacted := record_decoder(returns, self.decode)) is not None:
+                return compacted
+        return self.decode
+
+
+class Transport(_BaseTransport):
+    """Owns the single long-lived `httpx.Client` that every endpoint group sends through.
+
+    Connections are pooled and kept alive between calls, so a sync of many items
+    pays the TCP/TLS handshake once per pooled connection instead of once per request.
+
+    Args:
+        url: Base url of the Directus instance
+        token: Static or access token sent as a Bearer token
+        limits: Connection pool limits (default: `DEFAULT_LIMITS`)
+        http2: Negotiate HTTP/2 when the server supports it (requires `httpx[http2]`)
+        timeout: Request timeout (default: `DEFAULT_TIMEOUT`)
+        headers: Extra headers sent with every request
+        cache: Optional `ResponseCache` for GET responses, may be shared between transports
+            (entries are kept apart per instance and `Authorization` header)
+        coalesce: Share one in-flight request between identical concurrent `call('GET', ...)`s.
+            Callers receive the same decoded object, copy it before mutating
+        decoder: JSON backend (`'auto'` uses orjson or msgspec when installed) or a decode function
+        structs: Decode endpoint results into msgspec structs generated from the schema
+            TypedDicts (see `struct_for`, requires `msgspec`)
+        records: Convert endpoint results into compact `__slots__` records generated from
+            the schema TypedDicts (see `record_class`)
+        retry: When to resend failed requests (default: `DEFAULT_RETRY`), `None` to never retry
+        rate_limit: Optional `RateLimiter`, may be shared between transports
+        **client_options: Passed through to `httpx.Client`
+    """
+
+    _client = Client
+    _flights = SingleFlight
+    client: Client
+    flights: SingleFlight | None
+
+    def request(self, method: Method, path: str, *, params: QueryParams | None = None, json: Any = None, **options: Any) -> Response:
+        """Send a request on the pooled client and raise `DirectusError` on failure"""
+        if self._cacheable(method, params):
+            return self._cached(path, **options)
+        response = self._send(method, path, params=params, json=json, **options)
+        self._written(method, path)
+        return response
+
+    def _send(self, method: Method, path: str, **options: Any) -> Response:
+        """Send with the rate limit and retry policy applied"""
+        attempt = 0
+        while True:
+            if self.rate_limit is not None:
+                self.rate_limit.acquire()
+            try:
+                response = self.client.request(method, path, **options)
+            except TransportError:
+                if (delay := self._backoff(method, attempt, None, options)) is None:
+                    raise
+            else:
+                if not response.is_error:
+                    return response
+                response.read()
+                if (delay := self._backoff(method, attempt, response, options)) is None:
+                    raise DirectusError(response)
+            time.sleep(delay)
+            attempt += 1
+
+    def _cached(self, path: str, *, headers: dict[str, str] | None = None, **options: Any) -> Response:
+        """GET through the response cache, revalidating stale entries"""
+        assert self.cache is not None
+        scope = _scope(self.client, headers)
+        entry = self.cache.get(path, scope)
+        if entry is not None and entry.fresh:
+            return entry.response(self.client.build_request('GET', path))
+        validators = entry.validators() if entry is not None else {}
+        generation = self.cache.generation(path)
+        response = self._send('GET', path, headers={**validators, **(headers or {})}, **options)
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(path, entry)
+            return entry.response(response.request)
+        self.cache.store(path, response, scope, generation)
+        return response
+
+    def call(self, method: Method, path: str, *, params: QueryParams | None = None, json: Any = None, returns: str | None = None, **options: Any) -> Any:
+        """Send a request and return the unwrapped `data` member of the response.
+        `returns` is the annotation of the result, used to pick a struct decoder"""
+        decode = self._decoder(returns)
+        if self.flights is not None and method == 'GET' and json is None and not options:
+            return self.flights.do(_flight_key(path, params), lambda: _unwrap(self.request('GET', path, params=params), decode))
+        return _unwrap(self.request(method, path, params=params, json=json, **options), decode)
+
+    @contextmanager
+    def stream(self, method: Method, path: str, **options: Any) -> Iterator[Response]:
+        """Send a request without reading the body, raising `DirectusError` on failure.
+        Connection errors and error statuses are retried before the response is handed
+        out, errors while the caller reads the body are not"""
+        attempt = 0
+        while True:
+            if self.rate_limit is not None:
+                self.rate_limit.acquire()
+            with ExitStack() as stack:
+                try:
+                    response = stack.enter_context(self.client.stream(method, path, **options))
+                    if response.is_error:
+                        response.read()
+                except TransportError:
+                    if (delay := self._backoff(method, attempt, None, options)) is None:
+                        raise
+                else:
+                    if not response.is_error:
+                        yield response
+                        return
+                    if (delay := self._backoff(method, attempt, response, options)) is None:
+                        raise DirectusError(response)
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class AsyncTransport(_BaseTransport):
+    """Async counterpart of `Transport`, owning a single pooled `httpx.AsyncClient`.
+
+    Takes the same arguments as `Transport`. Concurrent coroutines share the
+    pool, so hundreds of in-flight calls need no thread per request.
+    """
+
+    _client = AsyncClient
+    _flights = AsyncSingleFlight
+    client: AsyncClient
+    flights: AsyncSingleFlight | None
+
+    async def request(self, method: Method, path: str, *, params: QueryParams | None = None, json: Any = None, **options: Any) -> Response:
+        """Send a request on the pooled client and raise `DirectusError` on failure"""
+        if self._cacheable(method, params):
+            return await self._cached(path, **options)
+        response = await self._send(method, path, params=params, json=json, **options)
+        self._written(method, path)
+        return response
+
+    async def _send(self, method: Method, path: str, **options: Any) -> Response:
+        """Send with the rate limit and retry policy applied"""
+        attempt = 0
+        while True:
+            if self.rate_limit is not None:
+                await self.rate_limit.aacquire()
+            try:
+                response = await self.client.request(method, path, **options)
+            except TransportError:
+                if (delay := self._backoff(method, attempt, None, options)) is None:
+                    raise
+            else:
+                if not response.is_error:
+                    return response
+                await response.aread()
+                if (delay := self._backoff(method, attempt, response, options)) is None:
+                    raise DirectusError(response)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _cached(self, path: str, *, headers: dict[str, str] | None = None, **options: Any) -> Response:
+        """GET through the response cache, revalidating stale entries"""
+        assert self.cache is not None
+        scope = _scope(self.client, headers)
+        entry = self.cache.get(path, scope)
+        if entry is not None and entry.fresh:
+            return entry.response(self.client.build_request('GET', path))
+        validators = entry.validators() if entry is not None else {}
+        generation = self.cache.generation(path)
+        response = await self._send('GET', path, headers={**validators, **(headers or {})}, **options)
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(path, entry)
+            return entry.response(response.request)
+        self.cache.store(path, response, scope, generation)
+        return response
+
+    async def call(self, method: Method, path: str, *, params: QueryParams | None = None, json: Any = None, returns: str | None = None, **options: Any) -> Any:
+        """Send a request and return the unwrapped `data` member of the response.
+        `returns` is the annotation of the result, used to pick a struct decoder"""
+        decode = self._decoder(returns)
+        if self.flights is not None and method == 'GET' and json is None and not options:
+            return await self.flights.do(_flight_key(path, params), lambda: self._get(path, params, decode))
+        return _unwrap(await self.request(method, path, params=params, json=json, **options), decode)
+
+    async def _get(self, path: str, params: QueryParams | None, decode: Decoder) -> Any:
+        return _unwrap(await self.request('GET', path, params=params), decode)
+
+    @asynccontextmanager
+    async def stream(self, method: Method, path: str, **options: Any) -> AsyncIterator[Response]:
+        """Send a request without reading the body, raising `DirectusError` on failure.
+        Connection errors and error statuses are retried before the response is handed
+        out, errors while the caller reads the body are not"""
+        attempt = 0
+        while True:
+            if self.rate_limit is not None:
+                await self.rate_limit.aacquire()
+            async with AsyncExitStack() as stack:
+                try:
+                    response = await stack.enter_async_context(self.client.stream(method, path, **options))
+                    if response.is_error:
+                        await response.aread()
+                except TransportError:
+                    if (delay := self._backoff(method, attempt, None, options)) is None:
+                        raise
+                else:
+                    if not response.is_error:
+                        yield response
+                        return
+                    if (delay := self._backoff(method, attempt, response, options)) is None:
+                        raise DirectusError(response)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> AsyncTransport:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
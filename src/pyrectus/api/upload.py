@@ -0,0 +1,136 @@
+from __future__ import annotations
+import asyncio
+import json
+import mimetypes
+import os
+import secrets
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+__all__ = ['Upload', 'Source', 'DEFAULT_CHUNK_SIZE']
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+"""Bytes read from the source per chunk. Bounds the memory used per upload"""
+
+Source = str | os.PathLike[str] | BinaryIO | bytes | Iterable[bytes] | AsyncIterable[bytes]
+"""A file path, binary file object, bytes, or a (async) iterator of byte chunks"""
+
+
+def _quote(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class Upload:
+    """Streaming `multipart/form-data` body for `/files`.
+
+    The file is read `chunk_size` bytes at a time while the request is sent, so
+    memory use does not depend on the file size. `data` (title, folder, ...) is
+    written before the file part, as Directus requires. When the size of the
+    source is known a `Content-Length` is sent, otherwise the body is chunked.
+
+    Example:
+        ```
+        files.upload(Upload('video.mp4', data={'folder': folder_id}))
+        ```
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        *,
+        filename: str | None = None,
+        content_type: str | None = None,
+        data: dict[str, Any] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.source = source
+        self.chunk_size = chunk_size
+        if filename is None:
+            name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', None)
+            filename = Path(name).name if isinstance(name, (str, os.PathLike)) else 'file'
+        self.filename = filename
+        self.content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        self.boundary = secrets.token_hex(16)
+
+        parts = [
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            f'{value if isinstance(value, str) else json.dumps(value)}\r\n'
+            for name, value in (data or {}).items()
+        ]
+        parts.append(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="file"; filename="{_quote(filename)}"\r\n'
+            f'Content-Type: {self.content_type}\r\n\r\n'
+        )
+        self.preamble = ''.join(parts).encode()
+        self.epilogue = f'\r\n--{self.boundary}--\r\n'.encode()
+
+    @classmethod
+    def of(cls, source: Source | Upload, **options: Any) -> Upload:
+        """`source` itself if it is already an `Upload`, else an `Upload` of it with `options`"""
+        return source if isinstance(source, Upload) else cls(source, **options)
+
+    def _size(self) -> int | None:
+        source = self.source
+        if isinstance(source, bytes):
+            return len(source)
+        if isinstance(source, (str, os.PathLike)):
+            return os.stat(source).st_size
+        if hasattr(source, 'seek') and hasattr(source, 'tell'):
+            try:
+                position = source.tell()
+                return source.seek(0, os.SEEK_END) - source.seek(position)
+            except OSError:
+                return None
+        return None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {'Content-Type': f'multipart/form-data; boundary={self.boundary}'}
+        if (size := self._size()) is not None:
+            headers['Content-Length'] = str(len(self.preamble) + size + len(self.epilogue))
+        return headers
+
+    def _chunks(self, file: BinaryIO) -> Iterator[bytes]:
+        while chunk := file.read(self.chunk_size):
+            yield chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        source = self.source
+        yield self.preamble
+        if isinstance(source, bytes):
+            for start in range(0, len(source), self.chunk_size):
+                yield source[start:start + self.chunk_size]
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as file:
+                yield from self._chunks(file)
+        elif hasattr(source, 'read'):
+            yield from self._chunks(source)
+        elif isinstance(source, Iterable):
+            yield from source
+        else:
+            raise TypeError('An async iterator source needs an AsyncTransport')
+        yield self.epilogue
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Async body. File reads run in a worker thread to keep the event loop free"""
+        source = self.source
+        if isinstance(source, AsyncIterable):
+            yield self.preamble
+            async for chunk in source:
+                yield chunk
+            yield self.epilogue
+            return
+        if isinstance(source, (str, os.PathLike)) or hasattr(source, 'read'):
+            file = open(source, 'rb') if isinstance(source, (str, os.PathLike)) else source
+            try:
+                yield self.preamble
+                while chunk := await asyncio.to_thread(file.read, self.chunk_size):
+                    yield chunk
+                yield self.epilogue
+            finally:
+                if file is not source:
+                    file.close()
+            return
+        for chunk in self:
+            yield chunk
@@ -0,0 +1,81 @@
+"""The `pyrectus` console script.
+
+Only typer is imported up front. Each command imports what it needs (httpx,
+yaml, openapi3-parser) when it runs, since the script is mostly started from
+cron and CI where startup dominates.
+"""
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+__all__ = ['app']
+
+app = typer.Typer(help='Directus client tools.', no_args_is_help=True)
+codegen = typer.Typer(help='Generate typed modules from the Directus OpenAPI spec or a live schema.', no_args_is_help=True)
+app.add_typer(codegen, name='codegen')
+
+Output = Annotated[Path | None, typer.Option('--output', '-o', help='File to write, stdout when omitted.')]
+
+
+def _write(source: str, output: Path | None) -> None:
+    if output is None:
+        typer.echo(source, nl=False)
+    else:
+        output.write_text(source, encoding='utf-8')
+        typer.echo(f'wrote {output}', err=True)
+
+
+@codegen.command('schema')
+def codegen_schema(spec: Path, output: Output = None) -> None:
+    """TypedDicts of the spec's component schemas (api/schema.py)."""
+    from .codegen import generate_schema, load_spec
+    _write(generate_schema(load_spec(spec), source=spec.name), output)
+
+
+@codegen.command('endpoints')
+def codegen_endpoints(spec: Path, output: Output = None) -> None:
+    """make_endpoint declarations of the spec's operations."""
+    from .codegen import generate_endpoints, load_spec
+    _write(generate_endpoints(load_spec(spec), source=spec.name), output)
+
+
+@codegen.command('items')
+def codegen_items(
+    source: Annotated[str, typer.Argument(help='Directus URL, or a schema snapshot JSON file.')],
+    token: Annotated[str | None, typer.Option(envvar='DIRECTUS_TOKEN', help='Static token for the URL.')] = None,
+    output: Output = None,
+) -> None:
+    """TypedDicts of a project's collections from its schema snapshot."""
+    from .codegen import generate_items
+    if Path(source).is_file():
+        snapshot = json.loads(Path(source).read_text(encoding='utf-8'))
+        snapshot = snapshot.get('data', snapshot)
+    else:
+        from .pyrectus import Directus
+        with Directus(source, token) as directus:
+            snapshot = directus.schema.get_snapshot()
+    _write(generate_items(snapshot, source=source), output)
+
+
+@app.command('import-time')
+def import_time(
+    module: str = 'pyrectus',
+    runs: int = 7,
+    budget: Annotated[float | None, typer.Option(help='Fail above this median, in milliseconds.')] = None,
+    forbid: Annotated[list[str] | None, typer.Option(help='Fail if the import loads this module.')] = None,
+) -> None:
+    """Measure `import MODULE` in fresh interpreters, as a CI guard against startup regressions."""
+    from .importtime import measure_import
+    profile = measure_import(module, runs)
+    typer.echo(f'{module}: {profile.seconds * 1000:.1f} ms median of {runs} (loads {", ".join(profile.loaded) or "no heavy modules"})')
+    failures = [name for name in forbid or () if name in profile.loaded]
+    if failures:
+        typer.echo(f'{module} imports {", ".join(failures)}', err=True)
+    if budget is not None and profile.seconds * 1000 > budget:
+        typer.echo(f'{module} is over the {budget:g} ms budget', err=True)
+        failures.append('budget')
+    if failures:
+        raise typer.Exit(1)
@@ -0,0 +1,315 @@
+"""Build time generators for the typed layer of pyrectus.
+
+`generate_schema` and `generate_endpoints` read the Directus OpenAPI spec and
+emit the schema TypedDicts and the `make_endpoint` declarations. `generate_items`
+emits TypedDicts for the collections of one project from a live schema snapshot.
+
+Example:
+    ```
+    spec = load_spec('submodules/openapi/openapi.yaml')
+    Path('src/pyrectus/api/schema.py').write_text(generate_schema(spec))
+    Path('myproject/items.py').write_text(generate_items(directus.schema.get_snapshot()))
+    ```
+"""
+from __future__ import annotations
+import json
+import keyword
+import os
+import re
+import textwrap
+from collections.abc import Iterable
+from itertools import count
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .api.columnar import _FIELD_DTYPES
+
+if TYPE_CHECKING:
+    from .api.schema import DirectusSchema
+
+__all__ = ['load_spec', 'generate_schema', 'generate_endpoints', 'generate_items']
+
+_METHODS = ('get', 'post', 'patch', 'delete', 'search')
+"""Operations `make_endpoint` can send, others are skipped"""
+
+_QUERY_PARAMS = {
+    'fields': 'FieldsParam',
+    'limit': 'Limit',
+    'meta': 'Meta',
+    'offset': 'Offset',
+    'page': 'Page',
+    'sort': 'Sort',
+    'filter': 'Filter',
+    'search': 'Search',
+    'aggregate': 'Aggregate',
+    'groupBy': 'GroupBy',
+    'deep': 'Deep',
+    'alias': 'Alias',
+    'export': 'Export',
+    'version': 'Version',
+    'versionRaw': 'VersionRaw',
+    'backlink': 'Backlink',
+}
+"""Query parameter name to the `DirectusParameter` that emits it"""
+
+_JSON_TYPES = {'string': 'str', 'integer': 'int', 'number': 'float', 'boolean': 'bool', 'object': 'dict[str, Any]'}
+
+_FIELD_TYPES = {
+    'integer': 'int',
+    'bigInteger': 'int',
+    'float': 'float',
+    'decimal': 'str',
+    'boolean': 'bool',
+    'json': 'Any',
+    'csv': 'list[str]',
+    'geometry': 'dict[str, Any]',
+}
+"""Directus field type to the type of its JSON value (decimals arrive as strings)"""
+
+
+def load_spec(source: str | os.PathLike[str]) -> dict[str, Any]:
+    """Validate an OpenAPI document with `openapi3-parser` and return it as loaded.
+
+    The generators work on the raw document, since the parsed models resolve
+    `$ref`s and lose the component names the TypedDicts are named after.
+    """
+    import yaml
+    from openapi_parser import parse
+
+    parse(str(source))
+    text = Path(source).read_text(encoding='utf-8')
+    return json.loads(text) if str(source).endswith('.json') else yaml.safe_load(text)
+
+
+def _singular(name: str) -> str:
+    if name.endswith('ies'):
+        return name[:-3] + 'y'
+    if name.endswith('s') and not name.endswith('ss'):
+        return name[:-1]
+    return name
+
+
+def _class_name(component: str) -> str:
+    return 'Directus' + _singular(re.sub(r'\W', '', component[:1].upper() + component[1:]))
+
+
+def _ref_name(ref: str) -> str:
+    return ref.rsplit('/', 1)[-1]
+
+
+def _resolve(spec: dict[str, Any], node: dict[str, Any]) -> dict[str, Any]:
+    """Follow a local `$ref` to the node it points at"""
+    while '$ref' in node:
+        target: Any = spec
+        for part in node['$ref'].lstrip('#/').split('/'):
+            target = target[part]
+        node = target
+    return node
+
+
+def _annotation(node: dict[str, Any] | None) -> str:
+    """Python annotation for a JSON schema node, component refs become TypedDict names"""
+    if not node:
+        return 'Any'
+    if '$ref' in node:
+        name = _ref_name(node['$ref'])
+        annotation = _class_name(name) if name.isidentifier() else 'Any'
+    elif options := node.get('oneOf') or node.get('anyOf'):
+        annotation = ' | '.join(dict.fromkeys(_annotation(option) for option in options))
+    elif node.get('allOf'):
+        annotation = _annotation(node['allOf'][0])
+    elif 'enum' in node and node.get('type', 'string') == 'string':
+        annotation = f'Literal[{", ".join(repr(v) for v in node["enum"] if v is not None)}]'
+    elif node.get('type') == 'array':
+        annotation = f'list[{_annotation(node.get("items"))}]'
+    else:
+        annotation = _JSON_TYPES.get(node.get('type', ''), 'Any')
+    if node.get('nullable') and annotation != 'Any':
+        annotation += ' | None'
+    return annotation
+
+
+def _docstring(text: str | None, indent: str = '    ') -> str:
+    if not text:
+        return ''
+    text = ' '.join(text.split()).replace('\\', '\\\\').replace('"""', '\\"\\"\\"')
+    lines = textwrap.wrap(text, 80) or ['']
+    return f'{indent}"""' + f'\n{indent}'.join(lines) + '"""\n'
+
+
+def _comment(text: str | None, indent: str = '    ') -> str:
+    if not text:
+        return ''
+    return ''.join(f'{indent}# {line}\n' for line in textwrap.wrap(' '.join(text.split()), 80))
+
+
+def _attribute(name: str) -> str | None:
+    return name if name.isidentifier() and not keyword.iskeyword(name) else None
+
+
+def _typeddict(name: str, fields: Iterable[tuple[str, str, str | None]], doc: str | None = None) -> str:
+    fields = list(fields)
+    if all(_attribute(field) is not None for field, _, _ in fields):
+        body = _docstring(doc)
+        for field, annotation, description in fields:
+            body += f'    {field}: {annotation}\n{_docstring(description)}\n'
+        return f'class {name}(TypedDict):\n{body or "    pass\n"}'
+    # Keys that are not identifiers (`x-y`, `class`) only fit the functional syntax,
+    # string annotations keep forward references lazy like the class syntax
+    entries = ''.join(f'{_comment(description)}    {field!r}: {annotation!r},\n' for field, annotation, description in fields)
+    return f'{name} = TypedDict({name!r}, {{\n{entries}}})\n{_docstring(doc, indent="")}\n'
+
+
+def _header(source: str, imports: str) -> str:
+    return (
+        'from __future__ import annotations\n\n'
+        f'{imports}\n\n'
+        f'# Generated from {source} by pyrectus.codegen, do not edit by hand\n\n'
+    )
+
+
+def generate_schema(spec: dict[str, Any], source: str = 'the Directus OpenAPI spec') -> str:
+    """Source of `api/schema.py`: one TypedDict per component schema"""
+    classes = []
+    for component, node in sorted(spec.get('components', {}).get('schemas', {}).items()):
+        if not component.isidentifier():
+            continue
+        node = _resolve(spec, node)
+        fields = [
+            (field, _annotation(prop), _resolve(spec, prop).get('description') if '$ref' not in prop else prop.get('description'))
+            for field, prop in (node.get('properties') or {}).items()
+        ]
+        classes.append(_typeddict(_class_name(component), fields, node.get('description')))
+    return _header(source, 'from typing import Any, TypedDict, Literal') + '\n'.join(classes)
+
+
+def _snake(name: str) -> str:
+    return re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', name).lower()
+
+
+def _returns(spec: dict[str, Any], operation: dict[str, Any]) -> str:
+    responses = operation.get('responses', {})
+    if '200' not in responses:
+        return 'None'
+    content = _resolve(spec, responses['200']).get('content', {})
+    if 'application/json' not in content:
+        return 'Response'
+    node = _resolve(spec, content['application/json'].get('schema', {}))
+    data = (node.get('properties') or {}).get('data')
+    return _annotation(data if data is not None else node)
+
+
+def _method_name(method: str, path: str, operation_id: str | None) -> str:
+    """`operationId` in snake case, else built from the method and path segments
+    (`delete_items_collection`), prefixed with the method if not an identifier"""
+    name = re.sub(r'[\W_]+', '_', _snake(operation_id or f'{method}_{path}')).strip('_')
+    return name if _attribute(name) is not None else f'{method}_{name}'
+
+
+def _endpoint(spec: dict[str, Any], path: str, method: str, operation: dict[str, Any], shared: list[dict[str, Any]], taken: dict[str, set[str]]) -> tuple[str, str, str]:
+    """`(group, source, returns)` of one `make_endpoint` declaration. `taken` holds
+    the method names used so far per group, a repeated name gets a number"""
+    arguments: list[str] = []
+    params: list[str] = []
+    for parameter in (_resolve(spec, p) for p in [*shared, *operation.get('parameters', [])]):
+        if parameter.get('in') == 'path' and (name := _attribute(parameter['name'])):
+            arguments.append(f'{name}: {_annotation(parameter.get("schema"))}')
+        elif parameter.get('in') == 'query' and (param := _QUERY_PARAMS.get(parameter['name'])) and param not in params:
+            params.append(param)
+    for field in re.findall(r'{(\w+)}', path):
+        if not any(a.startswith(f'{field}:') for a in arguments):
+            arguments.append(f'{field}: str')
+    if body := operation.get('requestBody'):
+        content = _resolve(spec, body).get('content', {})
+        arguments.append(f'body: {_annotation(content["application/json"].get("schema")) if "application/json" in content else "Any"}')
+    if params:
+        arguments.append(f'*params: {" | ".join(params)}')
+    returns = _returns(spec, operation)
+    group = re.sub(r'\W', '', (operation.get('tags') or ['Misc'])[0].title())
+    name = base = _method_name(method, path, operation.get('operationId'))
+    names = taken.setdefault(group, set())
+    for n in count(2):
+        if name not in names:
+            break
+        name = f'{base}_{n}'
+    names.add(name)
+    allowed = f', ({params[0]},)' if len(params) == 1 else f', ({", ".join(params)})' if params else ''
+    source = (
+        f'    @make_endpoint({path!r}, {method.upper()!r}{allowed})\n'
+        f'    def {name}(self{"".join(", " + a for a in arguments)}) -> {returns}: ...\n'
+    )
+    return group, source, returns
+
+
+def generate_endpoints(spec: dict[str, Any], source: str = 'the Directus OpenAPI spec') -> str:
+    """Source of the `make_endpoint` declarations, one `_Endpoint` group per spec tag.
+
+    Only the declarations are generated. Hand written helpers (pagination, bulk
+    writes, downloads) live in subclasses of these groups. `RETURNS` lists the
+    schema return annotations, to build their decoders up front with `precompile`.
+    """
+    groups: dict[str, list[str]] = {}
+    taken: dict[str, set[str]] = {}
+    returns: dict[str, None] = {}
+    for path, item in spec.get('paths', {}).items():
+        shared = item.get('parameters', [])
+        for method in _METHODS:
+            if (operation := item.get(method)) is not None:
+                group, declaration, annotation = _endpoint(spec, path, method, operation, shared, taken)
+                groups.setdefault(group, []).append(declaration)
+                if 'Directus' in annotation:
+                    returns[annotation] = None
+    imports = (
+        'from typing import Any, Literal\n\n'
+        'from httpx import Response\n\n'
+        'from .endpoints import _Endpoint, make_endpoint\n'
+        f'from .params import {", ".join(sorted(set(_QUERY_PARAMS.values()) - {"FieldsParam"}))}, Fields as FieldsParam\n'
+        'from .schema import *'
+    )
+    classes = [f'class {group}(_Endpoint):\n\n' + '\n'.join(declarations) for group, declarations in sorted(groups.items())]
+    listed = ''.join(f'    {annotation!r},\n' for annotation in returns)
+    footer = f'\nRETURNS = (\n{listed})\n'
+    return _header(source, imports) + '\n'.join(classes) + footer
+
+
+def _item_class(collection: str) -> str:
+    return ''.join(part[:1].upper() + part[1:] for part in re.split(r'[^0-9A-Za-z]+', collection) if part) + 'Item'
+
+
+def generate_items(snapshot: DirectusSchema, source: str = 'a Directus schema snapshot') -> str:
+    """Source of a module with a TypedDict per user collection of a schema snapshot.
+
+    Many-to-one fields accept the key or the related item. The module also defines
+    `COLLECTIONS` (collection name to TypedDict) for `struct_for`/`record_class`, and
+    `DTYPES` (column dtypes) for `Items.table`.
+    """
+    collections = [
+        c['collection'] for c in snapshot.get('collections', [])
+        if not c['collection'].startswith('directus_') and c.get('schema') is not None
+    ]
+    related = {
+        (r['collection'], r['field']): r.get('related_collection')
+        for r in snapshot.get('relations', []) if r.get('related_collection')
+    }
+    classes = []
+    dtypes: dict[str, dict[str, str]] = {}
+    for collection in collections:
+        fields = []
+        for field in (f for f in snapshot.get('fields', []) if f['collection'] == collection):
+            annotation = _FIELD_TYPES.get(field.get('type') or '', 'str' if field.get('type') in _FIELD_DTYPES else 'Any')
+            if (target := related.get((collection, field['field']))) is not None:
+                annotation += f' | {_item_class(target)}' if target in collections else ' | dict[str, Any]'
+            if (field.get('schema') or {}).get('is_nullable') and annotation != 'Any':
+                annotation += ' | None'
+            fields.append((field['field'], annotation, (field.get('meta') or {}).get('note')))
+            dtypes.setdefault(collection, {})[field['field']] = _FIELD_DTYPES.get(field.get('type') or '', 'object')
+        note = next((c.get('meta') or {} for c in snapshot['collections'] if c['collection'] == collection), {}).get('note')
+        classes.append(_typeddict(_item_class(collection), fields, note or f'Item of `{collection}`'))
+    mapping = ''.join(f'    {c!r}: {_item_class(c)},\n' for c in collections)
+    types = ''.join(f'    {c!r}: {dtypes.get(c, {})!r},\n' for c in collections)
+    footer = (
+        f'\nCOLLECTIONS: dict[str, type] = {{\n{mapping}}}\n'
+        f'\nDTYPES: dict[str, dict[str, DType]] = {{\n{types}}}\n'
+    )
+    imports = 'from typing import Any, TypedDict\n\nfrom pyrectus.api.columnar import DType'
+    return _header(source, imports) + '\n'.join(classes) + footer
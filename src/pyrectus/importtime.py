@@ -0,0 +1,49 @@
+from __future__ import annotations
+import statistics
+import subprocess
+import sys
+from collections.abc import Iterable
+from typing import NamedTuple
+
+__all__ = ['HEAVY_MODULES', 'ImportProfile', 'measure_import']
+
+HEAVY_MODULES = ('httpx', 'typer', 'yaml', 'openapi_parser', 'msgspec', 'orjson', 'numpy', 'pyarrow')
+"""Dependencies that dominate startup, reported when an import loads them"""
+
+_PROBE = '''\
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(",".join(name for name in {heavy!r} if name in sys.modules))
+'''
+
+
+class ImportProfile(NamedTuple):
+    module: str
+    seconds: float
+    """Median time of `import module` over the runs"""
+    runs: tuple[float, ...]
+    loaded: tuple[str, ...]
+    """Heavy modules the import pulled in"""
+
+
+def measure_import(module: str = 'pyrectus', runs: int = 7, *, heavy: Iterable[str] = HEAVY_MODULES, python: str = sys.executable) -> ImportProfile:
+    """Time `import module` in `runs` fresh interpreters. Interpreter startup is
+    excluded, so the result is the cost the package adds to every CLI call.
+
+    Example:
+        ```
+        profile = measure_import('pyrectus')
+        assert profile.seconds < 0.05 and 'httpx' not in profile.loaded
+        ```
+    """
+    probe = _PROBE.format(module=module, heavy=tuple(heavy))
+    timings = []
+    loaded: tuple[str, ...] = ()
+    for _ in range(runs):
+        result = subprocess.run([python, '-c', probe], capture_output=True, text=True, check=True)
+        seconds, names = result.stdout.splitlines()[-2:]
+        timings.append(float(seconds))
+        loaded = tuple(filter(None, names.split(',')))
+    return ImportProfile(module, statistics.median(timings), tuple(timings), loaded)
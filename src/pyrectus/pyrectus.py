@@ -0,0 +1,138 @@
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
+
+if TYPE_CHECKING:
+    from .api import endpoints
+    from .api.transport import AsyncTransport, Transport
+
+__all__ = ['Directus', 'AsyncDirectus']
+
+_E = TypeVar('_E', bound='endpoints._Endpoint | endpoints._AsyncEndpoint')
+
+
+class _Group(Generic[_E]):
+    """Instantiate an endpoint group on first access, bound to the owner's transport.
+    The group is named rather than referenced, so `endpoints` is only imported then"""
+
+    def __init__(self, group: str) -> None:
+        self.group = group
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> _Group[_E]: ...
+    @overload
+    def __get__(self, instance: object, owner: type) -> _E: ...
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        group = instance.__dict__[self.name] = getattr(import_module('.api.endpoints', __package__), self.group)(instance.transport)
+        return group
+
+
+class Directus:
+    """Directus REST client. Every endpoint group shares one pooled `Transport`.
+
+    Example:
+        ```
+        with Directus('https://directus.example.com', token) as directus:
+            directus.activity.get_activities(Limit(10))
+        ```
+    """
+    activity: _Group[endpoints.Activity] = _Group('Activity')
+    assets: _Group[endpoints.Assets] = _Group('Assets')
+    auth: _Group[endpoints.Auth] = _Group('Auth')
+    collections: _Group[endpoints.Collections] = _Group('Collections')
+    comments: _Group[endpoints.Comments] = _Group('Comments')
+    dashboards: _Group[endpoints.Dashboards] = _Group('Dashboards')
+    extensions: _Group[endpoints.Extensions] = _Group('Extensions')
+    fields: _Group[endpoints.Fields] = _Group('Fields')
+    files: _Group[endpoints.Files] = _Group('Files')
+    folders: _Group[endpoints.Folders] = _Group('Folders')
+    items: _Group[endpoints.Items] = _Group('Items')
+    metrics: _Group[endpoints.Metrics] = _Group('Metrics')
+    notifications: _Group[endpoints.Notifications] = _Group('Notifications')
+    operations: _Group[endpoints.Operations] = _Group('Operations')
+    panels: _Group[endpoints.Panels] = _Group('Panels')
+    permissions: _Group[endpoints.Permissions] = _Group('Permissions')
+    policies: _Group[endpoints.Policies] = _Group('Policies')
+    presets: _Group[endpoints.Presets] = _Group('Presets')
+    relations: _Group[endpoints.Relations] = _Group('Relations')
+    revisions: _Group[endpoints.Revisions] = _Group('Revisions')
+    roles: _Group[endpoints.Roles] = _Group('Roles')
+    schema: _Group[endpoints.Schema] = _Group('Schema')
+    server: _Group[endpoints.Server] = _Group('Server')
+    settings: _Group[endpoints.Settings] = _Group('Settings')
+    shares: _Group[endpoints.Shares] = _Group('Shares')
+    translations: _Group[endpoints.Translations] = _Group('Translations')
+    users: _Group[endpoints.Users] = _Group('Users')
+    utils: _Group[endpoints.Utils] = _Group('Utils')
+    versions: _Group[endpoints.Versions] = _Group('Versions')
+
+    def __init__(self, url: str, token: str | None = None, *, transport: Transport | None = None, **transport_options: Any) -> None:
+        from .api.transport import Transport
+        self.transport = transport or Transport(url, token, **transport_options)
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def __enter__(self) -> Directus:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class AsyncDirectus:
+    """Async Directus REST client. Every endpoint group shares one pooled `AsyncTransport`.
+
+    Example:
+        ```
+        async with AsyncDirectus('https://directus.example.com', token) as directus:
+            await directus.activity.get_activities(Limit(10))
+        ```
+    """
+    activity: _Group[endpoints.AsyncActivity] = _Group('AsyncActivity')
+    assets: _Group[endpoints.AsyncAssets] = _Group('AsyncAssets')
+    auth: _Group[endpoints.AsyncAuth] = _Group('AsyncAuth')
+    collections: _Group[endpoints.AsyncCollections] = _Group('AsyncCollections')
+    comments: _Group[endpoints.AsyncComments] = _Group('AsyncComments')
+    dashboards: _Group[endpoints.AsyncDashboards] = _Group('AsyncDashboards')
+    extensions: _Group[endpoints.AsyncExtensions] = _Group('AsyncExtensions')
+    fields: _Group[endpoints.AsyncFields] = _Group('AsyncFields')
+    files: _Group[endpoints.AsyncFiles] = _Group('AsyncFiles')
+    folders: _Group[endpoints.AsyncFolders] = _Group('AsyncFolders')
+    items: _Group[endpoints.AsyncItems] = _Group('AsyncItems')
+    metrics: _Group[endpoints.AsyncMetrics] = _Group('AsyncMetrics')
+    notifications: _Group[endpoints.AsyncNotifications] = _Group('AsyncNotifications')
+    operations: _Group[endpoints.AsyncOperations] = _Group('AsyncOperations')
+    panels: _Group[endpoints.AsyncPanels] = _Group('AsyncPanels')
+    permissions: _Group[endpoints.AsyncPermissions] = _Group('AsyncPermissions')
+    policies: _Group[endpoints.AsyncPolicies] = _Group('AsyncPolicies')
+    presets: _Group[endpoints.AsyncPresets] = _Group('AsyncPresets')
+    relations: _Group[endpoints.AsyncRelations] = _Group('AsyncRelations')
+    revisions: _Group[endpoints.AsyncRevisions] = _Group('AsyncRevisions')
+    roles: _Group[endpoints.AsyncRoles] = _Group('AsyncRoles')
+    schema: _Group[endpoints.AsyncSchema] = _Group('AsyncSchema')
+    server: _Group[endpoints.AsyncServer] = _Group('AsyncServer')
+    settings: _Group[endpoints.AsyncSettings] = _Group('AsyncSettings')
+    shares: _Group[endpoints.AsyncShares] = _Group('AsyncShares')
+    translations: _Group[endpoints.AsyncTranslations] = _Group('AsyncTranslations')
+    users: _Group[endpoints.AsyncUsers] = _Group('AsyncUsers')
+    utils: _Group[endpoints.AsyncUtils] = _Group('AsyncUtils')
+    versions: _Group[endpoints.AsyncVersions] = _Group('AsyncVersions')
+
+    def __init__(self, url: str, token: str | None = None, *, transport: AsyncTransport | None = None, **transport_options: Any) -> None:
+        from .api.transport import AsyncTransport
+        self.transport = transport or AsyncTransport(url, token, **transport_options)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> AsyncDirectus:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from pyrectus.api.cache import ResponseCache
+from pyrectus.api.transport import AsyncTransport, DirectusError, Transport
+
+URL = 'http://directus.test'
+
+
+class Server:
+    """Mock Directus answering with the caller's token and a version bumped by writes"""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.version = 1
+        self.during_get = None
+        self.write_status = 204
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method != 'GET':
+            self.version += self.write_status < 400
+            return httpx.Response(self.write_status)
+        if self.during_get is not None:
+            self.during_get()
+        etag = f'"v{self.version}"'
+        if request.headers.get('if-none-match') == etag:
+            return httpx.Response(304, headers={'etag': etag})
+        body = {'data': {'path': request.url.path, 'token': request.headers.get('authorization'), 'version': self.version}}
+        return httpx.Response(200, headers={'etag': etag, 'content-type': 'application/json'}, content=json.dumps(body).encode())
+
+    def count(self, method: str = 'GET') -> int:
+        return sum(r.method == method for r in self.requests)
+
+
+@pytest.fixture
+def server() -> Server:
+    return Server()
+
+
+def _transport(server: Server, cache: ResponseCache, token: str | None = 'a') -> Transport:
+    return Transport(URL, token, cache=cache, coalesce=False, retry=None, transport=httpx.MockTransport(server))
+
+
+def test_tokens_sharing_a_cache_are_kept_apart(server: Server) -> None:
+    cache = ResponseCache()
+    alice, bob = _transport(server, cache, 'alice'), _transport(server, cache, 'bob')
+    assert alice.call('GET', '/collections')['token'] == 'Bearer alice'
+    assert bob.call('GET', '/collections')['token'] == 'Bearer bob'
+    assert alice.call('GET', '/collections')['token'] == 'Bearer alice'
+    assert bob.call('GET', '/collections', headers={'Authorization': 'Bearer carol'})['token'] == 'Bearer carol'
+    assert server.count() == 3 and len(cache) == 3
+
+
+def test_async_and_sync_transports_share_entries(server: Server) -> None:
+    cache = ResponseCache()
+    _transport(server, cache).call('GET', '/fields')
+
+    async def read() -> dict:
+        async with AsyncTransport(URL, 'a', cache=cache, transport=httpx.MockTransport(server)) as transport:
+            return await transport.call('GET', '/fields')
+
+    assert asyncio.run(read())['version'] == 1
+    assert server.count() == 1
+
+
+def test_not_modified_refreshes_the_ttl(server: Server) -> None:
+    cache = ResponseCache()
+    transport = _transport(server, cache)
+    transport.call('GET', '/collections')
+    (entry,) = cache._entries.values()
+    entry.expires = 0.0
+    assert transport.call('GET', '/collections')['version'] == 1
+    assert server.requests[-1].headers['if-none-match'] == '"v1"'
+    assert entry.fresh
+    transport.call('GET', '/collections')
+    assert server.count() == 2
+
+
+def test_entry_without_ttl_is_always_revalidated(server: Server) -> None:
+    cache = ResponseCache(ttls={})
+    transport = _transport(server, cache)
+    for _ in range(3):
+        assert transport.call('GET', '/items/posts')['version'] == 1
+    assert server.count() == 3
+    assert [r.headers.get('if-none-match') for r in server.requests] == [None, '"v1"', '"v1"']
+
+
+def test_write_invalidates_its_segment(server: Server) -> None:
+    cache = ResponseCache(default_ttl=60.0)
+    transport = _transport(server, cache)
+    transport.call('GET', '/items/posts')
+    transport.call('GET', '/collections')
+    transport.call('PATCH', '/items/posts/1', json={'title': 'new'})
+    assert transport.call('GET', '/items/posts')['version'] == 2
+    assert transport.call('GET', '/collections')['version'] == 1
+    assert server.count() == 3
+
+
+def test_failed_write_keeps_entries(server: Server) -> None:
+    cache = ResponseCache(default_ttl=60.0)
+    transport = _transport(server, cache)
+    transport.call('GET', '/items/posts')
+    server.write_status = 403
+    with pytest.raises(DirectusError):
+        transport.call('PATCH', '/items/posts/1', json={})
+    assert len(cache) == 1
+
+
+def test_get_in_flight_during_a_write_is_not_stored(server: Server) -> None:
+    cache = ResponseCache(default_ttl=60.0)
+    transport = _transport(server, cache)
+    server.during_get = lambda: cache.invalidate('/items/posts/1')
+    assert transport.call('GET', '/items/posts')['version'] == 1
+    assert len(cache) == 0
+    server.during_get = None
+    transport.call('GET', '/items/posts')
+    assert len(cache) == 1
+
+
+def _response(size: int) -> httpx.Response:
+    return httpx.Response(200, headers={'etag': '"x"'}, content=b'x' * size)
+
+
+def test_eviction_is_bounded_by_bytes() -> None:
+    cache = ResponseCache(max_bytes=1000)
+    for name in 'abc':
+        cache.store(f'/items/{name}', _response(300))
+    assert len(cache) == 3 and cache.size <= 1000
+    cache.get('/items/a')
+    cache.store('/items/d', _response(300))
+    assert cache.get('/items/b') is None
+    assert all(cache.get(f'/items/{name}') is not None for name in 'acd')
+    assert cache.size == sum(entry.size for entry in cache._entries.values()) <= 1000
+
+
+def test_oversized_and_uncacheable_responses_are_not_stored() -> None:
+    cache = ResponseCache(max_bytes=100, ttls={})
+    cache.store('/items/a', _response(200))
+    cache.store('/items/b', httpx.Response(200, content=b'no validator'))
+    cache.store('/items/c', httpx.Response(404, headers={'etag': '"x"'}))
+    assert len(cache) == 0 and cache.size == 0
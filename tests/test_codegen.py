@@ -0,0 +1,121 @@
+import re
+import sys
+import types
+import typing
+
+import pytest
+
+from pyrectus.codegen import generate_endpoints, generate_items, generate_schema
+
+SPEC = {
+    'openapi': '3.0.1',
+    'info': {'title': 'fixture', 'version': '1'},
+    'paths': {
+        '/users': {
+            'get': {
+                'operationId': 'getUsers',
+                'tags': ['Users'],
+                'parameters': [{'$ref': '#/components/parameters/Fields'}, {'name': 'limit', 'in': 'query', 'schema': {'type': 'integer'}}],
+                'responses': {'200': {'description': 'ok', 'content': {'application/json': {'schema': {
+                    'type': 'object', 'properties': {'data': {'type': 'array', 'items': {'$ref': '#/components/schemas/Users'}}},
+                }}}}},
+            },
+        },
+        '/users/me': {
+            # Same operationId as /users, the generated method must not shadow it
+            'get': {'operationId': 'getUsers', 'tags': ['Users'], 'responses': {'204': {'description': 'none'}}},
+        },
+        '/items/{collection}': {
+            'parameters': [{'name': 'collection', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}],
+            'delete': {'tags': ['Items'], 'responses': {'204': {'description': 'gone'}}},
+            'get': {'tags': ['Items'], 'responses': {'200': {'description': 'ok', 'content': {'application/json': {'schema': {'type': 'object'}}}}}},
+        },
+        '/2fa/enable': {
+            'post': {'tags': ['Users'], 'requestBody': {'content': {'application/json': {'schema': {'type': 'object'}}}}, 'responses': {'204': {'description': 'ok'}}},
+        },
+    },
+    'components': {
+        'parameters': {'Fields': {'name': 'fields', 'in': 'query', 'schema': {'type': 'array', 'items': {'type': 'string'}}}},
+        'schemas': {
+            'Users': {'type': 'object', 'description': 'A user.', 'properties': {
+                'id': {'type': 'string', 'description': 'Primary key, with a """ quote.'},
+                'status': {'type': 'string', 'enum': ['active', 'suspended']},
+                'role': {'nullable': True, 'oneOf': [{'type': 'string'}, {'$ref': '#/components/schemas/Roles'}]},
+                'x-forwarded': {'type': 'string', 'description': 'Not an identifier.'},
+                'class': {'type': 'integer'},
+            }},
+            'Roles': {'type': 'object', 'properties': {
+                'id': {'type': 'string'},
+                'users': {'type': 'array', 'items': {'$ref': '#/components/schemas/Users'}},
+            }},
+        },
+    },
+}
+
+SNAPSHOT = {
+    'collections': [
+        {'collection': 'blog_posts', 'schema': {}, 'meta': {'note': 'Posts'}},
+        {'collection': 'authors', 'schema': {}},
+        {'collection': 'folder', 'schema': None},
+        {'collection': 'directus_users', 'schema': {}},
+    ],
+    'fields': [
+        {'collection': 'blog_posts', 'field': 'id', 'type': 'integer', 'schema': {'is_nullable': False}},
+        {'collection': 'blog_posts', 'field': 'author', 'type': 'integer', 'schema': {'is_nullable': True}, 'meta': {'note': 'Who wrote it'}},
+        {'collection': 'blog_posts', 'field': 'editor', 'type': 'uuid', 'schema': {'is_nullable': True}},
+        {'collection': 'blog_posts', 'field': 'price', 'type': 'decimal', 'schema': {'is_nullable': True}},
+        {'collection': 'blog_posts', 'field': 'seo-title', 'type': 'string', 'schema': {}},
+        {'collection': 'authors', 'field': 'id', 'type': 'integer', 'schema': {}},
+        {'collection': 'authors', 'field': 'from', 'type': 'json', 'schema': {}},
+    ],
+    'relations': [
+        {'collection': 'blog_posts', 'field': 'author', 'related_collection': 'authors'},
+        {'collection': 'blog_posts', 'field': 'editor', 'related_collection': 'directus_users'},
+    ],
+}
+
+
+def _module(name: str, source: str) -> types.ModuleType:
+    """Import generated source as a real module, so forward references resolve"""
+    module = types.ModuleType(name)
+    sys.modules[name] = module
+    exec(compile(source, name, 'exec'), module.__dict__)
+    return module
+
+
+@pytest.mark.parametrize('source', [generate_schema(SPEC), generate_endpoints(SPEC), generate_items(SNAPSHOT)], ids=['schema', 'endpoints', 'items'])
+def test_output_compiles_without_trailing_whitespace(source: str) -> None:
+    compile(source, 'generated', 'exec')
+    assert not re.search(r'[ \t]+$', source, re.M)
+
+
+def test_schema() -> None:
+    schema = _module('generated_schema', generate_schema(SPEC))
+    assert typing.is_typeddict(schema.DirectusUser)
+    hints = typing.get_type_hints(schema.DirectusUser)
+    assert {'x-forwarded', 'class', 'id', 'status', 'role'} <= set(hints)
+    assert hints['role'] == str | schema.DirectusRole | None
+    assert hints['class'] is int
+    assert typing.get_type_hints(schema.DirectusRole)['users'] == list[schema.DirectusUser]
+
+
+def test_endpoints() -> None:
+    source = generate_endpoints(SPEC)
+    names = re.findall(r'def (\w+)\(', source)
+    assert 'delete_items_collection' in names
+    assert 'get_items_collection' in names
+    assert 'post_2fa_enable' in names
+    assert names.count('get_users') == 1 and 'get_users_2' in names
+    assert "    @make_endpoint('/items/{collection}', 'DELETE')\n    def delete_items_collection(self, collection: str) -> None: ..." in source
+    assert "RETURNS = (\n    'list[DirectusUser]',\n)" in source
+
+
+def test_items() -> None:
+    items = _module('generated_items', generate_items(SNAPSHOT))
+    assert set(items.COLLECTIONS) == {'blog_posts', 'authors'}
+    hints = typing.get_type_hints(items.BlogPostsItem)
+    assert hints['author'] == int | items.AuthorsItem | None
+    assert hints['editor'] == str | dict[str, typing.Any] | None
+    assert 'seo-title' in hints and 'from' in typing.get_type_hints(items.AuthorsItem)
+    assert items.DTYPES['blog_posts'] == {'id': 'int', 'author': 'int', 'editor': 'str', 'price': 'float', 'seo-title': 'str'}
+    assert items.DTYPES['authors']['from'] == 'object'
@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+import random
+import re
+import xml.dom.minidom
+
+import pytest
+import yaml
+
+from pyrectus.api.export import _Joiner, plan_pages
+from pyrectus.api.params import Fields, Filter, Limit, Offset, Sort
+
+FORMATS = ['csv', 'json', 'xml', 'yaml']
+
+
+def _records(ids: list[int]) -> list[dict]:
+    return [{'id': i, 'name': f'név, {i} 🐍', 'score': i * 1.5} for i in ids]
+
+
+def _render(format: str, records: list[dict], rng: random.Random) -> bytes:
+    """One page as Directus renders it, with the variations seen between versions"""
+    if format == 'json':
+        text = json.dumps(records, ensure_ascii=False, indent=rng.choice([None, '\t']))
+    elif format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, ['id', 'name', 'score'])
+        writer.writeheader()
+        writer.writerows(records)
+        text = buffer.getvalue() if rng.random() < 0.5 else buffer.getvalue().rstrip('\r\n')
+    elif format == 'xml':
+        if not records and rng.random() < 0.5:
+            text = '<?xml version="1.0" encoding="utf-8"?>\n<data/>'
+        else:
+            text = '<?xml version="1.0" encoding="utf-8"?>\n<data>\n' + ''.join(
+                f'    <data>\n        <id>{r["id"]}</id>\n        <name>{r["name"]}</name>\n    </data>\n' for r in records
+            ) + '</data>'
+    else:
+        text = yaml.safe_dump(records, allow_unicode=True, sort_keys=False)
+    return text.encode()
+
+
+def _read(format: str, document: bytes) -> list[int]:
+    """Ids in a joined document, which must parse as one document of its format"""
+    text = document.decode()
+    if format == 'json':
+        return [r['id'] for r in json.loads(text)]
+    if format == 'csv':
+        return [int(r['id']) for r in csv.DictReader(io.StringIO(text))]
+    if format == 'xml':
+        root = xml.dom.minidom.parseString(document).documentElement
+        return [int(e.firstChild.data) for e in root.getElementsByTagName('id')]
+    return [r['id'] for r in yaml.safe_load(text) or []]
+
+
+def _join(format: str, pages: list[bytes], rng: random.Random) -> bytes:
+    out = bytearray()
+    joiner = _Joiner(format, out.extend)
+    joiner.window = rng.choice([16, 64, 1024])  # a window must hold the closing part
+    for n, page in enumerate(pages):
+        joiner.begin(last=n == len(pages) - 1)
+        pos = 0
+        while pos < len(page):
+            size = rng.randint(1, 40)
+            joiner.feed(page[pos:pos + size])
+            pos += size
+        joiner.end()
+    return bytes(out)
+
+
+@pytest.mark.parametrize('format', FORMATS)
+@pytest.mark.parametrize('seed', range(40))
+def test_join_random_pages(format: str, seed: int) -> None:
+    rng = random.Random(seed)
+    pages = [sorted(rng.sample(range(1000), rng.choice([0, 0, 1, 3, 20]))) for _ in range(rng.randint(1, 6))]
+    ids = [i for page in pages for i in page]
+    document = _join(format, [_render(format, _records(page), rng) for page in pages], rng)
+    assert _read(format, document) == ids
+
+
+@pytest.mark.parametrize('format', FORMATS)
+@pytest.mark.parametrize('empty', [(0,), (2,), (0, 2), (1,), (0, 1, 2)])
+def test_empty_pages(format: str, empty: tuple[int, ...]) -> None:
+    rng = random.Random(0)
+    pages = [[] if n in empty else [3 * n + 1, 3 * n + 2] for n in range(3)]
+    document = _join(format, [_render(format, _records(page), rng) for page in pages], rng)
+    assert _read(format, document) == [i for page in pages for i in page]
+
+
+def test_no_separator_before_closing_bracket() -> None:
+    rng = random.Random(0)
+    pages = [_render('json', _records([1, 2]), rng), _render('json', _records([6]), rng), b'[]']
+    document = _join('json', pages, rng)
+    assert re.search(rb',\s*\]', document) is None
+    assert [r['id'] for r in json.loads(document)] == [1, 2, 6]
+
+
+def test_single_page_passes_through() -> None:
+    rng = random.Random(0)
+    for format in FORMATS:
+        page = _render(format, _records([1, 2, 3]), rng)
+        assert _join(format, [page], rng) == page
+
+
+def test_plan_pages_uses_key_ranges() -> None:
+    stats = [{'count': 250, 'min': {'id': 1}, 'max': {'id': 250}}]
+    pages = plan_pages((Fields('id'), Filter('status', '_eq', 'ok')), 100, 'id', stats)
+    assert len(pages) == 3
+    for page in pages:
+        assert not any(isinstance(p, Offset) for p in page)
+        assert any(isinstance(p, Sort) for p in page)
+        assert sum(isinstance(p, Filter) for p in page) == 3
+
+
+def test_plan_pages_empty_and_unpaged() -> None:
+    (page,) = plan_pages((), 100, 'id', [{'count': 0, 'min': {'id': None}, 'max': {'id': None}}])
+    assert [(type(p), p.limit) for p in page] == [(Limit, 0)]
+    assert [type(p) for p in plan_pages((Fields('id'),), None, 'id', None)[0]] == [Fields, Limit]
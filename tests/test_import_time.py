@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyrectus.importtime import HEAVY_MODULES, measure_import
+
+SRC = str(Path(__file__).resolve().parents[1] / 'src')
+
+
+@pytest.fixture(autouse=True)
+def _child_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fresh interpreters import pyrectus from this checkout"""
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(filter(None, [SRC, os.environ.get('PYTHONPATH')])))
+
+
+def _probe(code: str) -> None:
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_import_loads_no_heavy_module() -> None:
+    profile = measure_import('pyrectus', runs=1)
+    assert profile.loaded == ()
+    assert len(profile.runs) == 1 and profile.seconds > 0
+
+
+@pytest.mark.parametrize('name', ['Directus', 'AsyncDirectus'])
+def test_client_is_what_pulls_in_httpx(name: str) -> None:
+    """Reading the client class is still free, the transport of an instance loads httpx"""
+    _probe(
+        'import sys, pyrectus\n'
+        f'assert not any(m in sys.modules for m in {HEAVY_MODULES!r}), sorted(sys.modules)\n'
+        f'client = pyrectus.{name}\n'
+        'assert "httpx" not in sys.modules\n'
+        'client("http://directus.invalid")\n'
+        'assert "httpx" in sys.modules\n'
+        'assert "typer" not in sys.modules and "pyrectus.api.endpoints" not in sys.modules\n'
+    )
+
+
+def test_transport_access_pulls_in_httpx() -> None:
+    _probe(
+        'import sys, pyrectus\n'
+        'pyrectus.Transport\n'
+        'assert "httpx" in sys.modules\n'
+    )
+
+
+def test_lazy_names_are_listed() -> None:
+    _probe(
+        'import pyrectus\n'
+        'assert set(pyrectus.__all__) <= set(dir(pyrectus))\n'
+        'try:\n'
+        '    pyrectus.missing\n'
+        'except AttributeError:\n'
+        '    pass\n'
+        'else:\n'
+        '    raise SystemExit("no AttributeError")\n'
+    )
+
+
+def test_import_time_command() -> None:
+    from typer.testing import CliRunner
+
+    from pyrectus.cli import app
+    result = CliRunner().invoke(app, ['import-time', '--runs', '1', '--forbid', 'httpx'])
+    assert result.exit_code == 0, result.output
+    assert 'no heavy modules' in result.output
@@ -0,0 +1,176 @@
+import asyncio
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from pyrectus.api.retry import RateLimiter, RetryPolicy
+from pyrectus.api.transport import AsyncTransport, DirectusError, Transport
+
+URL = 'http://directus.test'
+
+
+class Clock:
+    """Stands in for `time.monotonic` and `time.sleep`, sleeping advances the clock"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def asleep(self, seconds: float) -> None:
+        """Records only, so concurrent tasks all reserve at the same instant"""
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(time, 'sleep', clock.sleep)
+    monkeypatch.setattr(asyncio, 'sleep', clock.asleep)
+    return clock
+
+
+def _server(*responses: httpx.Response | Exception) -> tuple[httpx.MockTransport, list[httpx.Request]]:
+    """Answers with `responses` in turn, repeating the last one"""
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses[min(len(requests), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.MockTransport(handle), requests
+
+
+def _ok() -> httpx.Response:
+    return httpx.Response(200, json={'data': 'ok'})
+
+
+def test_retry_after_seconds(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(429, headers={'Retry-After': '7'}), _ok())
+    assert Transport(URL, transport=mock).call('GET', '/items/posts') == 'ok'
+    assert len(requests) == 2 and clock.sleeps == [7.0]
+
+
+def test_retry_after_http_date(clock: Clock) -> None:
+    when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    mock, requests = _server(httpx.Response(429, headers={'Retry-After': when}), _ok())
+    assert Transport(URL, transport=mock).call('GET', '/items/posts') == 'ok'
+    (wait,) = clock.sleeps
+    assert 28 < wait <= 30 and len(requests) == 2
+
+
+def test_retry_after_beyond_the_limit_is_not_waited_for(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(429, headers={'Retry-After': '3600'}), _ok())
+    with pytest.raises(DirectusError) as error:
+        Transport(URL, transport=mock).call('GET', '/items/posts')
+    assert error.value.status_code == 429 and len(requests) == 1 and clock.sleeps == []
+
+
+def test_backoff_is_capped_full_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('pyrectus.api.retry.random.uniform', lambda low, high: high)
+    policy = RetryPolicy(attempts=8, backoff=0.5, max_backoff=3.0)
+    assert [policy.delay('GET', n) for n in range(8)] == [0.5, 1.0, 2.0, 3.0, 3.0, 3.0, 3.0, None]
+    assert policy.delay('GET', 0, httpx.Response(400)) is None
+
+
+def test_post_is_not_retried_by_default(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(503), _ok())
+    with pytest.raises(DirectusError):
+        Transport(URL, transport=mock).call('POST', '/items/posts', json={})
+    assert len(requests) == 1
+
+
+def test_post_is_retried_when_listed(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(503), _ok())
+    transport = Transport(URL, retry=RetryPolicy(methods=('GET', 'POST')), transport=mock)
+    assert transport.call('POST', '/items/posts', json={}) == 'ok'
+    assert len(requests) == 2
+
+
+def test_streamed_request_body_is_not_retried(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(503), _ok())
+    transport = Transport(URL, retry=RetryPolicy(methods=('POST',)), transport=mock)
+    with pytest.raises(DirectusError):
+        transport.request('POST', '/files', content=iter([b'chunk']))
+    assert len(requests) == 1
+
+
+class _Broken(httpx.SyncByteStream):
+    def __iter__(self) -> Iterator[bytes]:
+        yield b'{"data": ['
+        raise httpx.ReadError('connection reset')
+
+
+def test_stream_retries_only_before_the_response_is_handed_out(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(503), httpx.ConnectError('refused'), httpx.Response(200, stream=_Broken()))
+    with pytest.raises(httpx.ReadError):
+        with Transport(URL, transport=mock).stream('GET', '/items/posts') as response:
+            response.read()
+    assert len(requests) == 3 and len(clock.sleeps) == 2
+
+
+def test_attempts_exhausted_raises_directus_error(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(503, json={'errors': [{'message': 'down'}]}))
+    with pytest.raises(DirectusError) as error:
+        Transport(URL, retry=RetryPolicy(attempts=3), transport=mock).call('GET', '/items/posts')
+    assert error.value.status_code == 503 and error.value.errors == [{'message': 'down'}]
+    assert len(requests) == 3 and len(clock.sleeps) == 2
+
+
+def test_connection_errors_exhausted_are_reraised(clock: Clock) -> None:
+    mock, requests = _server(httpx.ConnectError('refused'))
+    with pytest.raises(httpx.ConnectError):
+        Transport(URL, retry=RetryPolicy(attempts=2), transport=mock).call('DELETE', '/items/posts/1')
+    assert len(requests) == 2
+
+
+def test_async_transport_retries(clock: Clock) -> None:
+    mock, requests = _server(httpx.Response(429, headers={'Retry-After': '2'}), _ok())
+
+    async def call() -> str:
+        async with AsyncTransport(URL, transport=mock) as transport:
+            return await transport.call('GET', '/items/posts')
+
+    assert asyncio.run(call()) == 'ok'
+    assert len(requests) == 2 and clock.sleeps == [2.0]
+
+
+def test_rate_limiter_spacing(clock: Clock) -> None:
+    limiter = RateLimiter(10, burst=3)
+    starts = []
+    for _ in range(6):
+        limiter.acquire()
+        starts.append(clock.now - 1000.0)
+    assert starts == pytest.approx([0.0, 0.0, 0.0, 0.1, 0.2, 0.3])
+    clock.now += 10
+    limiter.acquire()
+    assert clock.sleeps == pytest.approx([0.1, 0.1, 0.1])
+
+
+def test_rate_limiter_async_callers_share_the_bucket(clock: Clock) -> None:
+    limiter = RateLimiter(4)
+
+    async def burst() -> None:
+        await asyncio.gather(*(limiter.aacquire() for _ in range(6)))
+
+    asyncio.run(burst())
+    assert sorted(clock.sleeps) == pytest.approx([0.25, 0.5])
+
+
+def test_rate_limiter_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(0)
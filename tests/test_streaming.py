@@ -0,0 +1,98 @@
+import json
+import random
+
+import pytest
+
+from pyrectus.api.streaming import DataParser, iter_data
+
+RECORDS = [
+    {'id': 1, 'title': 'plain', 'score': 12345, 'ratio': -0.5e10, 'draft': False},
+    {'id': 22, 'title': 'café, naïve, 日本語', 'score': 0, 'ratio': 1.25, 'draft': True},
+    {'id': 333, 'title': 'emoji 🐍 and \\"quotes\\" \n', 'score': -987654321, 'ratio': 3e-7, 'draft': None},
+    {'id': 4444, 'tags': ['ü', 'ß', '€'], 'nested': {'deep': [1, 2.5, {'x': 'ÿ'}]}},
+    'a bare string ✓',
+    123456789012345678901234567890,
+    -0.0001,
+    True,
+    None,
+    [],
+    {},
+]
+
+
+def _split(body: bytes, rng: random.Random, max_chunk: int) -> list[bytes]:
+    """`body` cut at random byte offsets, so chunks end inside numbers and characters"""
+    chunks, pos = [], 0
+    while pos < len(body):
+        size = rng.randint(1, max_chunk)
+        chunks.append(body[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def _parse(chunks: list[bytes]) -> list:
+    parser = DataParser()
+    items = [item for chunk in chunks for item in parser.feed(chunk)]
+    return items + parser.close()
+
+
+@pytest.mark.parametrize('seed', range(50))
+@pytest.mark.parametrize('indent', [None, 2])
+def test_random_chunk_boundaries(seed: int, indent: int | None) -> None:
+    document = {'meta': {'total_count': len(RECORDS), 'filter_count': 7}, 'data': RECORDS, 'after': [1, {'b': 'é'}]}
+    body = json.dumps(document, ensure_ascii=False, indent=indent).encode()
+    rng = random.Random(seed)
+    assert _parse(_split(body, rng, rng.choice([1, 3, 16, 256]))) == RECORDS
+
+
+def test_every_two_way_split() -> None:
+    body = json.dumps({'data': [1, 23, 456, -7.5e3, 'é🐍', 1e100, 0], 'meta': {'n': 890}}, ensure_ascii=False).encode()
+    expected = json.loads(body)['data']
+    for cut in range(len(body) + 1):
+        assert _parse([body[:cut], body[cut:]]) == expected, cut
+
+
+def test_number_at_chunk_edge_is_not_cut_short() -> None:
+    parser = DataParser()
+    items = parser.feed(b'{"data":[1,2')
+    for chunk in (b'34', b'5.', b'5e', b'+'):
+        items += parser.feed(chunk)
+        assert items == [1]
+    items += parser.feed(b'2,6]}')
+    assert items + parser.close() == [1, 2345.5e2, 6]
+
+
+def test_split_multibyte_character() -> None:
+    body = json.dumps({'data': ['€']}, ensure_ascii=False).encode()
+    chunks = [bytes([b]) for b in body]
+    assert _parse(chunks) == ['€']
+
+
+@pytest.mark.parametrize('body', [b'{"data":[]}', b' { "meta" : { } , "data" : [ ] } ', b'{"data":[],"meta":{"total_count":0}}'])
+def test_empty_data(body: bytes) -> None:
+    assert _parse([body]) == []
+    assert _parse([bytes([b]) for b in body]) == []
+
+
+def test_items_are_yielded_before_the_body_ends() -> None:
+    parser = DataParser()
+    assert parser.feed(b'{"data":[{"id":1},{"id":') == [{'id': 1}]
+
+
+def test_iter_data() -> None:
+    body = json.dumps({'data': RECORDS}).encode()
+    assert list(iter_data(_split(body, random.Random(0), 5))) == RECORDS
+
+
+@pytest.mark.parametrize('body', [b'{"data":[1,2', b'{"data":[1]', b'{"data":[{"id":1}'])
+def test_incomplete_document(body: bytes) -> None:
+    parser = DataParser()
+    parser.feed(body)
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize('body', [b'[1,2]', b'{"data":{"id":1}}', b'{"data":[]}{}', b'{"data" 1}'])
+def test_malformed_document(body: bytes) -> None:
+    with pytest.raises(ValueError):
+        _parse([body])